@@ -1,6 +1,6 @@
 """Main application controller that coordinates all components."""
 
-import subprocess
+import functools
 import threading
 import tkinter as tk
 import tkinter.font as tkFont
@@ -8,7 +8,6 @@ import tkinter.font as tkFont
 from config import config
 from core.note_manager import NoteManager
 from curator.curator import CuratorManager
-from llm import llm_client, LLMError
 from ui.fonts import FONT_FAMILY
 from ui.overlays import TooltipManager
 from ui.text_widget import QuipTextWidget
@@ -32,6 +31,14 @@ class QuipApplication:
         self.note_manager = NoteManager()
         self.voice_handler = VoiceHandler()
 
+        # Pending Tk timers for the tab gesture. The press side arms the
+        # hold check; the release side runs the debounce check and then
+        # the tail stop. They get separate slots because a re-press can
+        # legitimately overlap a pending tail timer, which must survive
+        # to clear the tail state.
+        self._tab_hold_timer_id = None
+        self._tab_release_timer_id = None
+
         # Initialize UI
         self._setup_ui()
 
@@ -108,9 +115,13 @@ class QuipApplication:
         self.text_widget.bind_key("<Control-z>", self._undo_improvement)
         self.text_widget.bind_key("<Control-l>", self._toggle_curator_mode)
 
-        # Voice recording
-        self.text_widget.bind_key("<KeyPress-Tab>", self._on_tab_press)
-        self.text_widget.bind_key("<KeyRelease-Tab>", self._on_tab_release)
+        # Voice recording: bind cached bound methods so Tk holds the
+        # callable directly instead of re-resolving the attribute per
+        # event at keyboard repeat rate
+        self._on_tab_press_bound = self._on_tab_press
+        self._on_tab_release_bound = self._on_tab_release
+        self.text_widget.bind_key("<KeyPress-Tab>", self._on_tab_press_bound)
+        self.text_widget.bind_key("<KeyRelease-Tab>", self._on_tab_release_bound)
 
         # Window manager protocol
         self.root.protocol("WM_DELETE_WINDOW", self.root.destroy)
@@ -152,6 +163,8 @@ class QuipApplication:
 
     def _open_settings(self, event=None) -> None:
         """Open settings file in default editor and close Quip."""
+        import subprocess  # Deferred - only needed on this cold path
+
         try:
             # Open config file with default editor
             subprocess.Popen(
@@ -210,15 +223,44 @@ class QuipApplication:
         """Handle Tab key press for voice recording."""
         should_break, action = self.voice_handler.on_tab_press()
 
-        if action == "start_timing":
-            # Schedule hold check after threshold
-            self.root.after(
+        if action == "start_timing" or (
+            action == "continue_hold" and not self.voice_handler.recording_mode
+        ):
+            # Schedule hold check after threshold. A tap's release cancels
+            # its hold timer, so a re-press inside the debounce window
+            # ("continue_hold" before recording starts) must arm a fresh
+            # one or holding through the re-press would never record.
+            self._schedule_tab_event(
+                "_tab_hold_timer_id",
                 int(self.voice_handler.tab_hold_threshold * 1000),
                 self.voice_handler.check_tab_hold,
             )
 
         return "break" if should_break else None
 
+    def _schedule_tab_event(self, slot: str, delay_ms: int, callback) -> None:
+        """Schedule a tab-gesture timer in the named slot.
+
+        Replaces any timer already pending in that slot, but never
+        touches the other slot.
+        """
+        pending = getattr(self, slot)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def fire():
+            setattr(self, slot, None)
+            callback()
+
+        setattr(self, slot, self.root.after(delay_ms, fire))
+
+    def _cancel_tab_event(self, slot: str) -> None:
+        """Cancel the pending timer in the named slot, if any."""
+        pending = getattr(self, slot)
+        if pending is not None:
+            self.root.after_cancel(pending)
+            setattr(self, slot, None)
+
     def _on_tab_release(self, event) -> str:
         """Handle Tab key release for voice recording."""
         should_break, action = self.voice_handler.on_tab_release()
@@ -227,11 +269,14 @@ class QuipApplication:
             # Don't process release immediately if we're in recording mode
             if self.voice_handler.recording_mode:
                 # Schedule a delayed check to see if we should stop recording
-                self.root.after(
+                self._schedule_tab_event(
+                    "_tab_release_timer_id",
                     int(self.voice_handler.release_debounce_time * 1000),
                     self._check_tab_release_final,
                 )
             else:
+                # Short tap - drop any pending hold check
+                self._cancel_tab_event("_tab_hold_timer_id")
                 # Process immediate release for short taps
                 action_result = self.voice_handler.process_immediate_tab_release()
                 if action_result == "insert_tab":
@@ -246,42 +291,45 @@ class QuipApplication:
 
         # Schedule actual stop after tail period if needed
         if self.voice_handler.recording_tail_active:
-            self.root.after(
+            self._schedule_tab_event(
+                "_tab_release_timer_id",
                 int(self.voice_handler.recording_tail_time * 1000),
                 self.voice_handler.stop_recording_tail,
             )
 
     def _on_transcription_complete(self, transcribed_text: str) -> None:
         """Handle successful transcription."""
+        # Update UI in main thread; partial over a bound method avoids
+        # allocating a fresh closure per transcription
+        self.root.after(
+            0, functools.partial(self._apply_transcription, transcribed_text)
+        )
 
-        def update_text():
-            if not transcribed_text.strip():
-                # Just update to normal state if no text
-                self.text_widget.hide_all_overlays()
-                return
-
-            # Check if voice auto-improvement is enabled
-            if config.voice_auto_improve and config.llm_enabled:
-                # Show processing overlay (shows "🧠 Processing audio...")
-                self.text_widget.show_processing_overlay()
-                # Start async improvement
-                self._improve_voice_text_async(transcribed_text)
-            else:
-                # Insert text normally without improvement
-                self.text_widget.insert_text_smart_spacing(transcribed_text)
+    def _apply_transcription(self, transcribed_text: str) -> None:
+        """Apply transcribed text to the UI (runs on the main thread)."""
+        if not transcribed_text.strip():
+            # Just update to normal state if no text
+            self.text_widget.hide_all_overlays()
+            return
 
-        # Update UI in main thread
-        self.root.after(0, update_text)
+        # Check if voice auto-improvement is enabled
+        if config.voice_auto_improve and config.llm_enabled:
+            # Show processing overlay (shows "🧠 Processing audio...")
+            self.text_widget.show_processing_overlay()
+            # Start async improvement
+            self._improve_voice_text_async(transcribed_text)
+        else:
+            # Insert text normally without improvement
+            self.text_widget.insert_text_smart_spacing(transcribed_text)
 
     def _on_transcription_error(self, error_message: str) -> None:
         """Handle transcription error."""
+        # Don't insert error text, just reset to normal empty state
+        self.root.after(0, self._reset_overlay)
 
-        def update_text():
-            # Don't insert error text, just reset to normal empty state
-            self.text_widget.hide_all_overlays()
-
-        # Update UI in main thread
-        self.root.after(0, update_text)
+    def _reset_overlay(self) -> None:
+        """Hide all overlays (runs on the main thread)."""
+        self.text_widget.hide_all_overlays()
 
     def _improve_voice_text_async(self, transcribed_text: str) -> None:
         """Improve voice-transcribed text asynchronously using LLM.
@@ -291,6 +339,8 @@ class QuipApplication:
         """
 
         def improvement_worker():
+            from llm import llm_client, LLMError
+
             try:
                 # Get vocabulary hints from config
                 vocabulary_hints = config.voice_vocabulary_hints
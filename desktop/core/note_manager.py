@@ -6,6 +6,9 @@ from pathlib import Path
 
 from config import config
 
+# Delimiter between notes batched into a single file by save_notes()
+NOTE_DELIMITER = "\n---\n"
+
 
 class NoteManager:
     """Handles note saving and file management operations.
@@ -18,6 +21,7 @@ class NoteManager:
     def __init__(self):
         self.save_dir = Path(config.save_path)
         self._last_saved_path: Path | None = None
+        self._save_dir_ready = False
 
     def save_note(self, content: str) -> bool:
         """Save note content as an individual file in the inbox directory.
@@ -38,12 +42,15 @@ class NoteManager:
             return False
 
         try:
-            self.save_dir.mkdir(parents=True, exist_ok=True)
+            # Only pay the mkdir syscalls once per directory
+            if not self._save_dir_ready:
+                self.save_dir.mkdir(parents=True, exist_ok=True)
+                self._save_dir_ready = True
 
-            # Save with timestamp filename
+            # Save with timestamp filename; encode once and write in one call
             timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S-%f")
             file_path = self.save_dir / f"{timestamp}.md"
-            file_path.write_text(content, encoding="utf-8")
+            file_path.write_bytes(content.encode("utf-8"))
             self._last_saved_path = file_path
 
             if config.debug_mode:
@@ -65,6 +72,46 @@ class NoteManager:
                 print(f"DEBUG: Failed to save note: {e}")
             return False
 
+    def save_notes(self, contents: list[str]) -> bool:
+        """Save several notes with a single write.
+
+        Joins the notes with the delimiter into one timestamped file so
+        N notes cost one open/write instead of N. Used when multiple
+        pending notes are flushed at once; no background rename, since a
+        batch has no single title.
+
+        Args:
+            contents: Note text contents to save
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        notes = [content.strip() for content in contents if content.strip()]
+        if not notes:
+            if config.debug_mode:
+                print("DEBUG: No content to save")
+            return False
+
+        try:
+            if not self._save_dir_ready:
+                self.save_dir.mkdir(parents=True, exist_ok=True)
+                self._save_dir_ready = True
+
+            timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S-%f")
+            file_path = self.save_dir / f"{timestamp}.md"
+            file_path.write_bytes(NOTE_DELIMITER.join(notes).encode("utf-8"))
+            self._last_saved_path = file_path
+
+            if config.debug_mode:
+                print(f"DEBUG: Saved {len(notes)} notes to {file_path}")
+
+            return True
+
+        except Exception as e:
+            if config.debug_mode:
+                print(f"DEBUG: Failed to save notes: {e}")
+            return False
+
     def _rename_with_llm(self, file_path: Path, content: str) -> None:
         """Rename a saved note file using an LLM-generated title."""
         try:
@@ -104,6 +151,7 @@ class NoteManager:
     def set_save_path(self, new_path: str | Path) -> None:
         """Update the save directory."""
         self.save_dir = Path(new_path)
+        self._save_dir_ready = False
 
     def validate_save_path(self) -> bool:
         """Validate that the save directory is writable.
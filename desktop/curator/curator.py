@@ -85,8 +85,7 @@ class CuratorManager:
         try:
             # Show loading state in curator area
             self.curator_text.config(state="normal")
-            self.curator_text.delete("1.0", "end")
-            self.curator_text.insert("1.0", "🤔 Analyzing your note...")
+            self.curator_text.replace("1.0", "end", "🤔 Analyzing your note...")
             self.curator_text.config(state="disabled")
 
             # Show curator frame if not already visible
@@ -100,8 +99,7 @@ class CuratorManager:
 
             # Update curator area with feedback
             self.curator_text.config(state="normal")
-            self.curator_text.delete("1.0", "end")
-            self.curator_text.insert("1.0", feedback)
+            self.curator_text.replace("1.0", "end", feedback)
             self.curator_text.config(state="disabled")
 
             # Store feedback for context in improvements
@@ -113,8 +111,7 @@ class CuratorManager:
         except Exception as e:
             # Show error in curator area
             self.curator_text.config(state="normal")
-            self.curator_text.delete("1.0", "end")
-            self.curator_text.insert("1.0", f"❌ Error getting feedback: {e}")
+            self.curator_text.replace("1.0", "end", f"❌ Error getting feedback: {e}")
             self.curator_text.config(state="disabled")
             if config.debug_mode:
                 print(f"DEBUG: Curator error: {e}")
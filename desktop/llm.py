@@ -107,6 +107,21 @@ class LLMClient:
         except Exception as e:
             raise LLMError(f"Request failed: {e}")
 
+    def warm_connection(self) -> None:
+        """Pre-resolve DNS and prime the TCP/TLS path to the LLM endpoint.
+
+        urllib opens a fresh socket per request so true pooling isn't
+        possible here, but a throwaway request moves DNS resolution and
+        TLS session setup off the first improve_note call. Best effort -
+        any failure is ignored and real requests report their own errors.
+        """
+        try:
+            request = urllib.request.Request(self.base_url, method="HEAD")
+            with urllib.request.urlopen(request, timeout=2):
+                pass
+        except Exception:
+            pass
+
     def improve_note(
         self,
         text: str,
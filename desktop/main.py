@@ -1,3 +1,5 @@
+import functools
+
 from config import config
 from core.app import QuipApplication
 
@@ -77,8 +79,9 @@ def validate_llm_config():
         print(f"❌ Unexpected Error: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_version():
-    """Get version from _version.py"""
+    """Get version from _version.py (cached after the first lookup)."""
     try:
         from _version import __version__
 
@@ -78,26 +78,22 @@ def test_voice_handler():
     print(f"   transcription_failed: {handler.transcription_failed}")
     print(f"   status: {handler.get_transcription_status()}")
 
-    print("\n3. Waiting for transcription to be ready (polling every 0.5s, max 60s)...")
+    print("\n3. Waiting for transcription to be ready (event wait, max 60s)...")
     start = time.time()
-    timeout = 60.0
-    while time.time() - start < timeout:
+    if handler._ready_event.wait(timeout=60.0):
         status = handler.get_transcription_status()
         elapsed = time.time() - start
-        print(f"   [{elapsed:.1f}s] status = {status}")
 
         if status == "ready":
             print(f"\n✓ VoiceHandler transcription ready in {elapsed:.2f}s!")
             # debug_mode restored automatically (read-only)
             return True
-        elif status == "failed":
-            print(f"\n✗ VoiceHandler transcription FAILED after {elapsed:.2f}s!")
-            # debug_mode restored automatically (read-only)
-            return False
 
-        time.sleep(0.5)
+        print(f"\n✗ VoiceHandler transcription FAILED after {elapsed:.2f}s!")
+        # debug_mode restored automatically (read-only)
+        return False
 
-    print(f"\n✗ VoiceHandler transcription timed out after {timeout}s!")
+    print("\n✗ VoiceHandler transcription timed out after 60s!")
     print("   Final state:")
     print(f"   transcription_service: {handler.transcription_service}")
     print(f"   transcription_loading: {handler.transcription_loading}")
@@ -1,13 +1,31 @@
 """Shared test fixtures and configuration."""
 
+import copy
 import sys
-import tempfile
+import types
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, create_autospec, patch
 
 import pytest
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _patch_tk():
+    """Replace the tkinter widget classes once for the whole session.
+
+    Every UI test needs them mocked anyway, and a single start/stop
+    avoids paying mock.patch's save/restore bookkeeping per test.
+    Fixtures that need the constructor mocks can take this fixture and
+    reset the one they assert against.
+    """
+    patcher = patch.multiple(
+        "tkinter", Text=DEFAULT, Label=DEFAULT, Frame=DEFAULT, Toplevel=DEFAULT
+    )
+    mocks = patcher.start()
+    yield mocks
+    patcher.stop()
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _mock_sounddevice():
     """Stub sounddevice module so voice_recorder can be imported without PortAudio."""
@@ -17,81 +35,64 @@ def _mock_sounddevice():
     sys.modules.setdefault("sounddevice", mock_sd)
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
-
-
 @pytest.fixture
 def mock_config():
-    """Mock config object with default values."""
-    config = Mock()
-    config.window_width = 800
-    config.window_height = 150
-    config.transparency = 0.95
-    config.font_family = "DejaVu Sans"
-    config.save_path = "~/notes/Inbox"
-    config.debug_mode = False
-    config.llm_enabled = False
-    config.llm_model = "gpt-3.5-turbo"
-    config.llm_max_tokens = 150
-    config.llm_temperature = 0.7
-    config.llm_base_url = "https://api.openai.com/v1"
-    config.llm_api_key = ""
-    config.llm_timeout_seconds = 30
-    config.voice_hold_threshold_ms = 500
-    config.voice_recording_tail_ms = 800
-    config.voice_model_size = "small"
-    config.voice_language = "en"
-    config.config_file_path = Path("~/.config/quip/config.toml")
-    return config
-
-
-@pytest.fixture
-def mock_tkinter():
-    """Mock tkinter for testing without GUI."""
-    with patch("tkinter.Tk") as mock_tk:
-        mock_root = Mock()
-        mock_tk.return_value = mock_root
-
-        # Mock common tkinter methods
-        mock_root.winfo_screenwidth.return_value = 1920
-        mock_root.winfo_screenheight.return_value = 1080
-        mock_root.winfo_pointerx.return_value = 960
-        mock_root.winfo_pointery.return_value = 540
-        mock_root.geometry.return_value = "800x150+560+465"
-
-        with (
-            patch("tkinter.Frame") as mock_frame,
-            patch("tkinter.Text") as mock_text,
-            patch("tkinter.Label") as mock_label,
-        ):
-            yield {
-                "root": mock_root,
-                "frame": mock_frame,
-                "text": mock_text,
-                "label": mock_label,
-            }
+    """Config stub with default values.
+
+    A SimpleNamespace attribute bag - tests never assert calls on the
+    config itself, and it is much cheaper to build than a Mock.
+    """
+    return types.SimpleNamespace(
+        window_width=800,
+        window_height=150,
+        transparency=0.95,
+        font_family="DejaVu Sans",
+        save_path="~/notes/Inbox",
+        debug_mode=False,
+        llm_enabled=False,
+        llm_model="gpt-3.5-turbo",
+        llm_max_tokens=150,
+        llm_temperature=0.7,
+        llm_base_url="https://api.openai.com/v1",
+        llm_api_key="",
+        llm_timeout_seconds=30,
+        voice_hold_threshold_ms=500,
+        voice_recording_tail_ms=800,
+        voice_model_size="small",
+        voice_language="en",
+        config_file_path=Path("~/.config/quip/config.toml"),
+    )
+
+
+@pytest.fixture(scope="session")
+def _voice_components_template(_mock_sounddevice):
+    """Autospec'd voice component instances, built once per session.
+
+    create_autospec introspects the whole class, which is the expensive
+    part; per-test fixtures take copies instead of re-analysing.
+    """
+    from transcription import TranscriptionService
+    from voice_recorder import VoiceRecorder
+
+    return {
+        "recorder": create_autospec(VoiceRecorder, instance=True),
+        "transcription": create_autospec(TranscriptionService, instance=True),
+    }
 
 
 @pytest.fixture
-def mock_voice_components():
-    """Mock voice recording and transcription components."""
-    with (
-        patch("voice_recorder.VoiceRecorder") as mock_recorder,
-        patch("transcription.create_transcription_service") as mock_transcription,
-    ):
-        mock_recorder_instance = Mock()
-        mock_recorder_instance.start_recording.return_value = True
-        mock_recorder_instance.stop_recording.return_value = b"audio_data"
-        mock_recorder.return_value = mock_recorder_instance
-
-        mock_transcription_instance = Mock()
-        mock_transcription.return_value = mock_transcription_instance
-
-        yield {
-            "recorder": mock_recorder_instance,
-            "transcription": mock_transcription_instance,
-        }
+def mock_voice_components(_voice_components_template):
+    """Mock voice recording and transcription components.
+
+    Copies of the session autospecs, reset so call histories cannot
+    leak between tests, with the usual happy-path return values.
+    """
+    components = {
+        name: copy.copy(template)
+        for name, template in _voice_components_template.items()
+    }
+    for mock in components.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    components["recorder"].start_recording.return_value = True
+    components["recorder"].stop_recording.return_value = b"audio_data"
+    return components
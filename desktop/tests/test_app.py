@@ -1,40 +1,93 @@
 """Tests for core application module."""
 
+import copy
+import subprocess
+import tkinter
 from unittest.mock import Mock, patch
 
 import pytest
 
+from core import app as core_app
 from core.app import QuipApplication
 
 
+# Attribute sets the app actually touches on each component; spec_set
+# keeps attribute resolution a hash lookup and catches typos early
+_TEXT_WIDGET_SPEC = [
+    "text",
+    "bind_key",
+    "focus_set",
+    "get_text",
+    "set_text",
+    "insert_text",
+    "insert_text_smart_spacing",
+    "set_processing_state",
+    "show_empty_state",
+    "show_processing_overlay",
+    "show_recording_overlay",
+    "show_recording_tail_overlay",
+    "hide_all_overlays",
+    "on_text_change",
+]
+_NOTE_MANAGER_SPEC = ["save_note", "get_last_saved_path"]
+_CURATOR_MANAGER_SPEC = ["improve_note", "toggle_curator_mode", "undo_improvement"]
+
+
+@pytest.fixture(scope="session")
+def _component_mock_templates():
+    """Build component instance mocks once per session.
+
+    Tests copy these templates instead of constructing fresh Mock objects
+    for every test, which dominates fixture setup time.
+    """
+    templates = {
+        name: Mock()
+        for name in (
+            "root",
+            "frame",
+            "window_manager",
+            "voice_handler",
+            "tooltip_manager",
+        )
+    }
+    templates["text_widget"] = Mock(spec_set=_TEXT_WIDGET_SPEC)
+    templates["note_manager"] = Mock(spec_set=_NOTE_MANAGER_SPEC)
+    templates["curator_manager"] = Mock(spec_set=_CURATOR_MANAGER_SPEC)
+    return templates
+
+
+def _fresh_mock(templates, name):
+    """Copy a template mock and clear any state from previous tests."""
+    instance = copy.copy(templates[name])
+    instance.reset_mock(return_value=True, side_effect=True)
+    return instance
+
+
 class TestQuipApplication:
     """Test QuipApplication functionality."""
 
     @pytest.fixture
-    def mock_tkinter(self):
-        """Mock tkinter components."""
+    def mock_app_env(self, _component_mock_templates):
+        """Patch tkinter and every component class in one fixture.
+
+        Every test needs both, so entering all the patches together
+        halves the fixture enter/exit work per test.
+        """
         with (
-            patch("tkinter.Tk") as mock_tk,
-            patch("tkinter.Frame") as mock_frame,
+            patch.object(tkinter, "Tk") as mock_tk,
+            patch.object(tkinter, "Frame") as mock_frame,
+            patch.object(core_app, "WindowManager") as mock_window_manager,
+            patch.object(core_app, "NoteManager") as mock_note_manager,
+            patch.object(core_app, "VoiceHandler") as mock_voice_handler,
+            patch.object(core_app, "QuipTextWidget") as mock_text_widget,
+            patch.object(core_app, "CuratorManager") as mock_curator_manager,
+            patch.object(core_app, "TooltipManager") as mock_tooltip_manager,
         ):
-            mock_root = Mock()
+            mock_root = _fresh_mock(_component_mock_templates, "root")
             mock_tk.return_value = mock_root
-            mock_frame.return_value = Mock()
+            mock_frame.return_value = _fresh_mock(_component_mock_templates, "frame")
 
-            yield {"root": mock_root, "frame": mock_frame}
-
-    @pytest.fixture
-    def mock_components(self):
-        """Mock all component classes."""
-        with (
-            patch("core.app.WindowManager") as mock_window_manager,
-            patch("core.app.NoteManager") as mock_note_manager,
-            patch("core.app.VoiceHandler") as mock_voice_handler,
-            patch("core.app.QuipTextWidget") as mock_text_widget,
-            patch("core.app.CuratorManager") as mock_curator_manager,
-            patch("core.app.TooltipManager") as mock_tooltip_manager,
-        ):
-            yield {
+            components = {
                 "window_manager": mock_window_manager,
                 "note_manager": mock_note_manager,
                 "voice_handler": mock_voice_handler,
@@ -42,221 +95,248 @@ class TestQuipApplication:
                 "curator_manager": mock_curator_manager,
                 "tooltip_manager": mock_tooltip_manager,
             }
+            for name, mock_class in components.items():
+                mock_class.return_value = _fresh_mock(_component_mock_templates, name)
 
-    def test_text_widget_focus_wiring(self, mock_tkinter, mock_components):
-        """Test that text widget is properly wired to window manager for focus."""
-        # Create app instance
-        with patch("core.app.config"):
-            QuipApplication()
-
-            # Check that window manager has text widget reference for focus
-            mock_window_manager_instance = mock_components[
-                "window_manager"
-            ].return_value
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-
-            # The text widget should be assigned to window manager
-            assert (
-                mock_window_manager_instance.text_widget
-                == mock_text_widget_instance.text
-            )
-
-    def test_run_calls_ensure_focus(self, mock_tkinter, mock_components):
-        """Test that run method calls ensure_focus on window manager."""
-        with patch("core.app.config"):
-            app = QuipApplication()
-
-            mock_window_manager_instance = mock_components[
-                "window_manager"
-            ].return_value
+            yield {"root": mock_root, "frame": mock_frame, **components}
 
-            # Call run method
-            app.run()
+    @pytest.fixture(autouse=True, scope="module")
+    def _no_real_popen(self):
+        """Keep a fake Popen installed for the whole module.
 
-            # Should call ensure_focus before starting mainloop
-            mock_window_manager_instance.ensure_focus.assert_called_once()
-            mock_tkinter["root"].mainloop.assert_called_once()
+        Guards every test against spawning a real process and saves the
+        per-test patch pair test_open_settings used to pay.
+        """
+        with patch.object(subprocess, "Popen") as fake_popen:
+            yield fake_popen
 
-    def test_initial_empty_state_shown(self, mock_tkinter, mock_components):
-        """Test that empty state overlay is shown on app startup."""
-        with patch("core.app.config"):
-            QuipApplication()
+    @pytest.fixture(autouse=True)
+    def patched_config(self, monkeypatch):
+        """Swap core.app.config for a mock via direct attribute assignment.
 
-            mock_text_widget_instance = mock_components["text_widget"].return_value
+        monkeypatch reverts automatically and skips the per-test
+        mock.patch enter/exit machinery every test was paying for.
+        """
+        fake = Mock(debug_mode=False, config_file_path="/path/to/config.toml")
+        monkeypatch.setattr(core_app, "config", fake)
+        return fake
 
-            # Should call show_empty_state to initialize the overlay
-            mock_text_widget_instance.show_empty_state.assert_called_once()
+    def test_text_widget_focus_wiring(self, mock_app_env):
+        """Test that text widget is properly wired to window manager for focus."""
+        # Create app instance
+        QuipApplication()
 
-    def test_save_and_exit_with_text(self, mock_tkinter, mock_components):
-        """Test saving note with actual text content."""
-        with patch("core.app.config") as mock_config:
-            mock_config.debug_mode = False
-            app = QuipApplication()
+        # Check that window manager has text widget reference for focus
+        mock_window_manager_instance = mock_app_env["window_manager"].return_value
+        mock_text_widget_instance = mock_app_env["text_widget"].return_value
 
-            # Mock text widget to return some text
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-            mock_text_widget_instance.get_text.return_value = "  some note text  "
+        # The text widget should be assigned to window manager
+        assert (
+            mock_window_manager_instance.text_widget == mock_text_widget_instance.text
+        )
 
-            # Mock note manager save
-            mock_note_manager_instance = mock_components["note_manager"].return_value
-            mock_note_manager_instance.save_note.return_value = True
+    def test_run_calls_ensure_focus(self, mock_app_env):
+        """Test that run method calls ensure_focus on window manager."""
+        app = QuipApplication()
+
+        mock_window_manager_instance = mock_app_env["window_manager"].return_value
+
+        # Call run method
+        app.run()
+
+        # Should call ensure_focus before starting mainloop
+        mock_window_manager_instance.ensure_focus.assert_called_once()
+        mock_app_env["root"].mainloop.assert_called_once()
+
+    def test_tab_timer_slots_are_independent(self, mock_app_env):
+        """Test that each timer slot replaces itself but never the other."""
+        app = QuipApplication()
+        root = mock_app_env["root"]
+        root.after.reset_mock(side_effect=True)
+        root.after.side_effect = ["hold-1", "hold-2", "tail-1"]
+
+        app._schedule_tab_event("_tab_hold_timer_id", 100, Mock())
+        app._schedule_tab_event("_tab_hold_timer_id", 200, Mock())
+
+        # Rescheduling a slot cancels its own pending timer, not stacking
+        root.after_cancel.assert_called_once_with("hold-1")
+        assert app._tab_hold_timer_id == "hold-2"
+
+        # A pending tail timer survives hold-side scheduling (re-press
+        # during the recording tail relies on it firing)
+        app._schedule_tab_event("_tab_release_timer_id", 300, Mock())
+        root.after_cancel.assert_called_once()
+        assert app._tab_release_timer_id == "tail-1"
+
+        app._cancel_tab_event("_tab_hold_timer_id")
+        root.after_cancel.assert_called_with("hold-2")
+        assert app._tab_hold_timer_id is None
+        assert app._tab_release_timer_id == "tail-1"
+
+    @pytest.mark.parametrize(
+        "action, recording_mode, expect_scheduled",
+        [
+            # First press always arms the hold check
+            ("start_timing", False, True),
+            # Re-press within the debounce window after a tap: the tap's
+            # release cancelled the timer, so it must be re-armed
+            ("continue_hold", False, True),
+            # Re-press while already recording needs no hold check
+            ("continue_hold", True, False),
+            ("ignore_repeat", False, False),
+        ],
+    )
+    def test_tab_press_arms_hold_check(
+        self, mock_app_env, action, recording_mode, expect_scheduled
+    ):
+        """Test which press actions (re-)arm the hold-check timer."""
+        app = QuipApplication()
+        root = mock_app_env["root"]
+        root.after.reset_mock(side_effect=True)
+
+        voice_handler = mock_app_env["voice_handler"].return_value
+        voice_handler.on_tab_press.return_value = (True, action)
+        voice_handler.recording_mode = recording_mode
+        voice_handler.tab_hold_threshold = 0.5
+
+        app._on_tab_press(None)
+
+        if expect_scheduled:
+            root.after.assert_called_once()
+            assert root.after.call_args.args[0] == 500
+        else:
+            root.after.assert_not_called()
+
+    def test_initial_empty_state_shown(self, mock_app_env):
+        """Test that empty state overlay is shown on app startup."""
+        QuipApplication()
 
-            # Call save and exit
-            app._save_and_exit(None)
+        mock_text_widget_instance = mock_app_env["text_widget"].return_value
 
-            # Should save the original text (stripping is only for checking if there's content)
-            mock_note_manager_instance.save_note.assert_called_once_with(
-                "  some note text  "
-            )
-            mock_tkinter["root"].destroy.assert_called_once()
+        # Should call show_empty_state to initialize the overlay
+        mock_text_widget_instance.show_empty_state.assert_called_once()
 
-    def test_save_and_exit_with_empty_text(self, mock_tkinter, mock_components):
-        """Test that empty text doesn't get saved."""
-        with patch("core.app.config"):
-            app = QuipApplication()
+    @pytest.mark.parametrize(
+        "text, expect_save",
+        [
+            ("  some note text  ", True),
+            ("   \n  \t  ", False),
+        ],
+    )
+    def test_save_and_exit(self, mock_app_env, text, expect_save):
+        """Test saving on exit: real content is saved, whitespace is not."""
+        app = QuipApplication()
 
-            # Mock text widget to return empty text
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-            mock_text_widget_instance.get_text.return_value = "   \n  \t  "
+        mock_text_widget_instance = mock_app_env["text_widget"].return_value
+        mock_text_widget_instance.get_text.return_value = text
 
-            # Mock note manager
-            mock_note_manager_instance = mock_components["note_manager"].return_value
+        mock_note_manager_instance = mock_app_env["note_manager"].return_value
+        mock_note_manager_instance.save_note.return_value = True
 
-            # Call save and exit
-            app._save_and_exit(None)
+        # Call save and exit
+        app._save_and_exit(None)
 
-            # Should not save empty text
+        if expect_save:
+            # Saves the original text (stripping only decides if there is content)
+            mock_note_manager_instance.save_note.assert_called_once_with(text)
+        else:
             mock_note_manager_instance.save_note.assert_not_called()
-            mock_tkinter["root"].destroy.assert_called_once()
-
-    def test_improve_note_success(self, mock_tkinter, mock_components):
-        """Test successful note improvement."""
-        with patch("core.app.config"):
-            app = QuipApplication()
-
-            # Mock text widget and curator manager
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-            mock_text_widget_instance.get_text.return_value = "bad grammer text"
-
-            mock_curator_instance = mock_components["curator_manager"].return_value
-            mock_curator_instance.improve_note.return_value = (
-                True,
+        mock_app_env["root"].destroy.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "text, improve_result, expected_final_text",
+        [
+            # Success: widget gets the improved text
+            (
+                "bad grammer text",
+                (True, "improved grammar text"),
                 "improved grammar text",
-            )
-
-            # Call improve note
-            app._improve_note(None)
-
-            # Should set processing state, improve, and update text
-            mock_text_widget_instance.set_processing_state.assert_any_call(True)
-            mock_text_widget_instance.set_processing_state.assert_any_call(False)
-            mock_curator_instance.improve_note.assert_called_once_with(
-                "bad grammer text"
-            )
-            mock_text_widget_instance.set_text.assert_called_with(
-                "improved grammar text"
-            )
-
-    def test_improve_note_failure(self, mock_tkinter, mock_components):
-        """Test note improvement failure handling."""
-        with patch("core.app.config"):
-            app = QuipApplication()
-
-            # Mock text widget and curator manager
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-            mock_text_widget_instance.get_text.return_value = "original text"
-
-            mock_curator_instance = mock_components["curator_manager"].return_value
-            mock_curator_instance.improve_note.return_value = (False, "error message")
-
-            # Call improve note
-            app._improve_note(None)
-
-            # Should restore original text on failure
-            mock_text_widget_instance.set_text.assert_called_with("original text")
-
-    def test_improve_note_empty_text(self, mock_tkinter, mock_components):
-        """Test that empty text doesn't trigger improvement."""
-        with patch("core.app.config"):
-            app = QuipApplication()
-
-            # Mock text widget to return empty text
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-            mock_text_widget_instance.get_text.return_value = ""
-
-            mock_curator_instance = mock_components["curator_manager"].return_value
-
-            # Call improve note
-            app._improve_note(None)
-
-            # Should not attempt improvement
+            ),
+            # Failure: original text is restored
+            ("original text", (False, "error message"), "original text"),
+            # Empty input: improvement is never attempted
+            ("", None, None),
+        ],
+    )
+    def test_improve_note(
+        self, mock_app_env, text, improve_result, expected_final_text
+    ):
+        """Test note improvement success, failure and empty-input paths."""
+        app = QuipApplication()
+
+        mock_text_widget_instance = mock_app_env["text_widget"].return_value
+        mock_text_widget_instance.get_text.return_value = text
+
+        mock_curator_instance = mock_app_env["curator_manager"].return_value
+        mock_curator_instance.improve_note.return_value = improve_result
+
+        # Call improve note
+        app._improve_note(None)
+
+        if not text:
             mock_curator_instance.improve_note.assert_not_called()
+            return
 
-    def test_undo_improvement_success(self, mock_tkinter, mock_components):
+        # Should set processing state, improve, and update text
+        mock_text_widget_instance.set_processing_state.assert_any_call(True)
+        mock_text_widget_instance.set_processing_state.assert_any_call(False)
+        mock_curator_instance.improve_note.assert_called_once_with(text)
+        mock_text_widget_instance.set_text.assert_called_with(expected_final_text)
+
+    def test_undo_improvement_success(self, mock_app_env):
         """Test successful undo improvement."""
-        with patch("core.app.config"):
-            app = QuipApplication()
+        app = QuipApplication()
 
-            mock_text_widget_instance = mock_components["text_widget"].return_value
-            mock_curator_instance = mock_components["curator_manager"].return_value
-            mock_curator_instance.undo_improvement.return_value = (
-                True,
-                "original text",
-            )
+        mock_text_widget_instance = mock_app_env["text_widget"].return_value
+        mock_curator_instance = mock_app_env["curator_manager"].return_value
+        mock_curator_instance.undo_improvement.return_value = (
+            True,
+            "original text",
+        )
 
-            # Call undo improvement
-            app._undo_improvement(None)
+        # Call undo improvement
+        app._undo_improvement(None)
 
-            # Should set text to undone version
-            mock_text_widget_instance.set_text.assert_called_with("original text")
+        # Should set text to undone version
+        mock_text_widget_instance.set_text.assert_called_with("original text")
 
-    def test_transcription_complete_with_text(self, mock_tkinter, mock_components):
+    def test_transcription_complete_with_text(self, mock_app_env):
         """Test handling transcription completion with actual text."""
-        with patch("core.app.config"):
-            app = QuipApplication()
+        app = QuipApplication()
 
-            # Call transcription complete
-            app._on_transcription_complete("transcribed text")
+        # Call transcription complete
+        app._on_transcription_complete("transcribed text")
 
-            # Should schedule text insertion
-            mock_tkinter["root"].after.assert_called()
+        # Should schedule text insertion
+        mock_app_env["root"].after.assert_called()
 
-    def test_transcription_complete_empty(self, mock_tkinter, mock_components):
+    def test_transcription_complete_empty(self, mock_app_env):
         """Test handling transcription completion with empty text."""
-        with patch("core.app.config"):
-            app = QuipApplication()
+        app = QuipApplication()
 
-            # Call transcription complete with empty text
-            app._on_transcription_complete("  ")
+        # Call transcription complete with empty text
+        app._on_transcription_complete("  ")
 
-            # Should schedule overlay hiding
-            mock_tkinter["root"].after.assert_called()
+        # Should schedule overlay hiding
+        mock_app_env["root"].after.assert_called()
 
-    def test_transcription_error(self, mock_tkinter, mock_components):
+    def test_transcription_error(self, mock_app_env):
         """Test handling transcription error."""
-        with patch("core.app.config"):
-            app = QuipApplication()
+        app = QuipApplication()
 
-            # Call transcription error
-            app._on_transcription_error("error message")
+        # Call transcription error
+        app._on_transcription_error("error message")
 
-            # Should schedule overlay hiding
-            mock_tkinter["root"].after.assert_called()
+        # Should schedule overlay hiding
+        mock_app_env["root"].after.assert_called()
 
-    def test_open_settings(self, mock_tkinter, mock_components):
+    def test_open_settings(self, mock_app_env, _no_real_popen):
         """Test opening settings file."""
-        with (
-            patch("core.app.config") as mock_config,
-            patch("core.app.subprocess.Popen") as mock_popen,
-        ):
-            mock_config.config_file_path = "/path/to/config.toml"
-            mock_config.debug_mode = False
-
-            app = QuipApplication()
+        app = QuipApplication()
 
-            # Call open settings
-            app._open_settings(None)
+        # Call open settings
+        app._open_settings(None)
 
-            # Should open file and destroy window
-            mock_popen.assert_called_once()
-            mock_tkinter["root"].destroy.assert_called_once()
+        # Should open file and destroy window
+        _no_real_popen.assert_called_once()
+        mock_app_env["root"].destroy.assert_called_once()
@@ -1,29 +1,48 @@
 """Tests for curator module."""
 
+import tkinter
 from unittest.mock import Mock, patch
 
 import pytest
 
+import llm as llm_mod
+from curator import curator as curator_mod
 from curator.curator import CuratorManager
+from llm import LLMError
+
+# Shared exception instances; raising the same object per run avoids
+# re-constructing it and allows identity checks if ever needed
+_API_ERROR = LLMError("API Error")
 
 
 class TestCuratorManager:
     """Test CuratorManager functionality."""
 
     @pytest.fixture
-    def curator_manager(self, mock_tkinter, mock_config):
+    def curator_manager(self, mock_config):
         """Create a CuratorManager instance for testing."""
         mock_frame = Mock()
         mock_window_manager = Mock()
 
         with (
-            patch("tkinter.Frame") as mock_frame_class,
-            patch("tkinter.Text"),
-            patch("curator.curator.config", mock_config),
+            patch.object(tkinter, "Frame") as mock_frame_class,
+            patch.object(tkinter, "Text"),
+            patch.object(curator_mod, "config", mock_config),
         ):
             mock_frame_class.return_value = Mock()
             return CuratorManager(mock_frame, mock_window_manager)
 
+    @pytest.fixture
+    def patched_llm_client(self, monkeypatch):
+        """Swap llm.llm_client for a mock via direct attribute assignment.
+
+        Cheaper than the @patch decorator's target lookup and enter/exit
+        machinery; monkeypatch restores the real client automatically.
+        """
+        fake = Mock()
+        monkeypatch.setattr(llm_mod, "llm_client", fake)
+        return fake
+
     def test_curator_manager_creation(self, curator_manager):
         """Test CuratorManager initialization."""
         assert curator_manager.curator_mode is False
@@ -43,7 +62,7 @@ class TestCuratorManager:
         """Test toggling curator mode when LLM is disabled."""
         mock_config.llm_enabled = False
 
-        with patch("curator.curator.config", mock_config):
+        with patch.object(curator_mod, "config", mock_config):
             result = curator_manager.toggle_curator_mode("Test note")
 
         assert result is False
@@ -63,7 +82,7 @@ class TestCuratorManager:
         mock_config.llm_enabled = True
 
         with (
-            patch("curator.curator.config", mock_config),
+            patch.object(curator_mod, "config", mock_config),
             patch.object(curator_manager, "show_curator_feedback") as mock_show,
         ):
             result = curator_manager.toggle_curator_mode("Test note")
@@ -71,13 +90,12 @@ class TestCuratorManager:
             assert result is True
             mock_show.assert_called_once_with("Test note")
 
-    @patch("llm.llm_client")
     def test_show_curator_feedback_success(
-        self, mock_llm_client, curator_manager, mock_config
+        self, patched_llm_client, curator_manager, mock_config
     ):
         """Test showing curator feedback successfully."""
         mock_config.llm_enabled = True
-        mock_llm_client._make_request.return_value = {
+        patched_llm_client._make_request.return_value = {
             "choices": [{"message": {"content": "Test feedback"}}]
         }
 
@@ -87,21 +105,18 @@ class TestCuratorManager:
         assert curator_manager.current_curator_feedback == "Test feedback"
         curator_manager.window_manager.expand_window.assert_called_once()
 
-    @patch("llm.llm_client")
     def test_show_curator_feedback_error(
-        self, mock_llm_client, curator_manager, mock_config
+        self, patched_llm_client, curator_manager, mock_config
     ):
         """Test showing curator feedback with LLM error."""
-        from llm import LLMError
-
         mock_config.llm_enabled = True
-        mock_llm_client._make_request.side_effect = LLMError("API Error")
+        patched_llm_client._make_request.side_effect = _API_ERROR
 
         # Should not raise exception
         curator_manager.show_curator_feedback("Test note")
 
         # Error should be displayed in curator text
-        curator_manager.curator_text.insert.assert_called()
+        curator_manager.curator_text.replace.assert_called()
 
     def test_clear_curator_mode(self, curator_manager):
         """Test clearing curator mode."""
@@ -119,7 +134,7 @@ class TestCuratorManager:
         """Test improving note when LLM is disabled."""
         mock_config.llm_enabled = False
 
-        with patch("curator.curator.config", mock_config):
+        with patch.object(curator_mod, "config", mock_config):
             success, result = curator_manager.improve_note("Test note")
 
         assert success is False
@@ -129,32 +144,32 @@ class TestCuratorManager:
         """Test improving note with empty text."""
         mock_config.llm_enabled = True
 
-        with patch("curator.curator.config", mock_config):
+        with patch.object(curator_mod, "config", mock_config):
             success, result = curator_manager.improve_note("")
 
         assert success is False
         assert result == "No text to improve"
 
-    @patch("llm.llm_client")
-    def test_improve_note_success(self, mock_llm_client, curator_manager, mock_config):
+    def test_improve_note_success(
+        self, patched_llm_client, curator_manager, mock_config
+    ):
         """Test successfully improving a note."""
         mock_config.llm_enabled = True
-        mock_llm_client.improve_note.return_value = "Improved note text"
+        patched_llm_client.improve_note.return_value = "Improved note text"
 
-        with patch("curator.curator.config", mock_config):
+        with patch.object(curator_mod, "config", mock_config):
             success, result = curator_manager.improve_note("Original note")
 
         assert success is True
         assert result == "Improved note text"
         assert curator_manager.text_before_improvement == "Original note"
 
-    @patch("llm.llm_client")
-    def test_improve_note_error(self, mock_llm_client, curator_manager, mock_config):
+    def test_improve_note_error(self, patched_llm_client, curator_manager, mock_config):
         """Test improving note with error."""
         mock_config.llm_enabled = True
-        mock_llm_client.improve_note.side_effect = Exception("API Error")
+        patched_llm_client.improve_note.side_effect = Exception("API Error")
 
-        with patch("curator.curator.config", mock_config):
+        with patch.object(curator_mod, "config", mock_config):
             success, result = curator_manager.improve_note("Test note")
 
         assert success is False
@@ -181,48 +196,44 @@ class TestCuratorManager:
         assert result == original_text
         assert curator_manager.text_before_improvement is None
 
-    @patch("llm.llm_client")
-    def test_get_curator_feedback(self, mock_llm_client, curator_manager, mock_config):
+    def test_get_curator_feedback(
+        self, patched_llm_client, curator_manager, mock_config
+    ):
         """Test getting curator feedback from LLM."""
         mock_config.llm_enabled = True
-        mock_llm_client._make_request.return_value = {
+        patched_llm_client._make_request.return_value = {
             "choices": [{"message": {"content": "What is the next action?"}}]
         }
 
         feedback = curator_manager._get_curator_feedback("Test note")
 
         assert feedback == "What is the next action?"
-        mock_llm_client._make_request.assert_called_once()
+        patched_llm_client._make_request.assert_called_once()
 
-    @patch("llm.llm_client")
     def test_get_curator_feedback_no_choices(
-        self, mock_llm_client, curator_manager, mock_config
+        self, patched_llm_client, curator_manager, mock_config
     ):
         """Test getting curator feedback with no response choices."""
-        from llm import LLMError
-
         mock_config.llm_enabled = True
-        mock_llm_client._make_request.return_value = {"choices": []}
+        patched_llm_client._make_request.return_value = {"choices": []}
 
         with pytest.raises(LLMError):
             curator_manager._get_curator_feedback("Test note")
 
-    def test_improve_note_with_curator_context(self, curator_manager, mock_config):
+    def test_improve_note_with_curator_context(
+        self, patched_llm_client, curator_manager, mock_config
+    ):
         """Test improving note with curator context."""
         mock_config.llm_enabled = True
         curator_manager.curator_mode = True
         curator_manager.current_curator_feedback = "What is the deadline?"
+        patched_llm_client.improve_note.return_value = "Improved text"
 
-        with (
-            patch("curator.curator.config", mock_config),
-            patch("llm.llm_client") as mock_llm_client,
-        ):
-            mock_llm_client.improve_note.return_value = "Improved text"
-
+        with patch.object(curator_mod, "config", mock_config):
             success, result = curator_manager.improve_note("Test note")
 
-            # Should pass curator context to LLM
-            mock_llm_client.improve_note.assert_called_once_with(
-                "Test note", "What is the deadline?"
-            )
-            assert success is True
+        # Should pass curator context to LLM
+        patched_llm_client.improve_note.assert_called_once_with(
+            "Test note", "What is the deadline?"
+        )
+        assert success is True
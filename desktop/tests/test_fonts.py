@@ -0,0 +1,41 @@
+"""Tests for the fonts module."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ui import fonts
+
+
+class TestGetFont:
+    """Test lazy font construction and caching."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        """Isolate the module-level font cache per test."""
+        monkeypatch.setattr(fonts, "_font_cache", {})
+
+    def test_get_font_caches_per_style(self):
+        """Test that a style's Font is built once and then reused."""
+        with patch.object(fonts.tkfont, "Font") as mock_font:
+            mock_font.return_value = Mock()
+
+            first = fonts.get_font("recording")
+            second = fonts.get_font("recording")
+
+            assert first is second
+            mock_font.assert_called_once_with(font=fonts.RECORDING_FONT)
+
+    def test_get_font_falls_back_without_root(self):
+        """Test that the tuple spec is returned when Tk has no root yet."""
+        with patch.object(fonts.tkfont, "Font", side_effect=RuntimeError):
+            result = fonts.get_font("placeholder")
+
+        assert result == fonts.PLACEHOLDER_FONT
+        # Fallback is not cached, so a later call can still upgrade
+        assert fonts._font_cache == {}
+
+    def test_get_font_unknown_style(self):
+        """Test that an unknown style key raises KeyError."""
+        with pytest.raises(KeyError):
+            fonts.get_font("nonexistent")
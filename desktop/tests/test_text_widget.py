@@ -1,57 +1,102 @@
 """Tests for enhanced text widget with overlay management."""
 
-from unittest.mock import Mock, patch
+import copy
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from ui.fonts import MAIN_TEXT_FONT
 from ui.text_widget import QuipTextWidget
 
+# Full constructor kwargs the widget must pass to tk.Text; one dict
+# equality is cheaper and stricter than asserting keys individually
+_EXPECTED_TEXT_KWARGS = {
+    "font": MAIN_TEXT_FONT,
+    "wrap": "word",
+    "height": 4,
+    "bg": "#2b2b2b",
+    "fg": "#ffffff",
+    "insertbackground": "#ffffff",
+    "relief": "flat",
+    "padx": 8,
+    "pady": 8,
+    "bd": 0,
+}
+
+
+def _make_text_mock(*, bg="#2b2b2b", fg="#ffffff"):
+    """Build the per-test text mock with its side effects in one call.
+
+    Configuring behavior through Mock(**spec) avoids the lazy
+    child-mock creation each individual attribute assignment pays.
+    after_idle runs callbacks inline so the change-coalescing path
+    flushes immediately; compare reports a non-empty buffer so content
+    checks fall through to get().
+    """
+    return Mock(
+        **{
+            "cget.side_effect": lambda key: bg if key == "bg" else fg,
+            "after_idle.side_effect": lambda callback, *args: callback(*args),
+            "compare.return_value": False,
+        }
+    )
+
 
 class TestQuipTextWidget:
     """Test QuipTextWidget functionality."""
 
-    @pytest.fixture
-    def mock_tkinter(self):
-        """Mock tkinter components."""
-        with (
-            patch("tkinter.Text") as mock_text,
-            patch("ui.text_widget.OverlayManager") as mock_overlay_manager,
-        ):
-            mock_text_instance = Mock()
-            mock_text.return_value = mock_text_instance
-
+    @pytest.fixture(scope="module")
+    def _widget_env(self, _patch_tk):
+        """Construct one QuipTextWidget against the session tkinter mocks.
+
+        The initialization/binding tests assert against these
+        construction-time mocks; everything else copies the widget.
+        Only OverlayManager still needs its own (module-scoped) patch.
+        """
+        mock_text = _patch_tk["Text"]
+        # Clear construction history other modules may have left behind
+        mock_text.reset_mock(return_value=True, side_effect=True)
+        mock_text_instance = Mock()
+        mock_text.return_value = mock_text_instance
+
+        with patch("ui.text_widget.OverlayManager") as mock_overlay_manager:
             mock_overlay_manager_instance = Mock()
             mock_overlay_manager.return_value = mock_overlay_manager_instance
 
-            yield {
-                "text": mock_text,
-                "text_instance": mock_text_instance,
-                "overlay_manager": mock_overlay_manager,
-                "overlay_manager_instance": mock_overlay_manager_instance,
-            }
+            widget = QuipTextWidget(Mock())
+            yield (
+                widget,
+                {
+                    "text": mock_text,
+                    "text_instance": mock_text_instance,
+                    "overlay_manager": mock_overlay_manager,
+                    "overlay_manager_instance": mock_overlay_manager_instance,
+                },
+            )
 
     @pytest.fixture
-    def text_widget(self, mock_tkinter):
-        """Create a QuipTextWidget instance for testing."""
-        mock_parent = Mock()
-        widget = QuipTextWidget(mock_parent)
-        return widget, mock_tkinter
-
-    def test_text_widget_initialization(self, text_widget):
+    def text_widget(self, _widget_env):
+        """Per-test copy of the template widget with fresh child mocks so
+        call histories cannot leak between tests."""
+        template, mocks = _widget_env
+        widget = copy.copy(template)
+        widget.text = _make_text_mock()
+        widget.overlay_manager = Mock()
+        widget.on_text_change = None
+        widget._pending_change = None
+        return widget, {
+            **mocks,
+            "text_instance": widget.text,
+            "overlay_manager_instance": widget.overlay_manager,
+        }
+
+    def test_text_widget_initialization(self, _widget_env):
         """Test proper initialization of text widget."""
-        widget, mocks = text_widget
+        widget, mocks = _widget_env
 
-        # Should create text widget with correct configuration
+        # Should create text widget with exactly the expected configuration
         mocks["text"].assert_called_once()
-        call_args = mocks["text"].call_args
-
-        # Check key configuration parameters
-        assert call_args[1]["font"] == MAIN_TEXT_FONT
-        assert call_args[1]["wrap"] == "word"
-        assert call_args[1]["height"] == 4
-        assert call_args[1]["bg"] == "#2b2b2b"
-        assert call_args[1]["fg"] == "#ffffff"
+        assert mocks["text"].call_args.kwargs == _EXPECTED_TEXT_KWARGS
 
         # Should configure text widget
         mocks["text_instance"].configure.assert_called()
@@ -75,9 +120,10 @@ class TestQuipTextWidget:
 
         widget.set_text("new content")
 
-        # Should clear existing text and insert new content
-        mocks["text_instance"].delete.assert_called_once_with("1.0", "end")
-        mocks["text_instance"].insert.assert_called_once_with("1.0", "new content")
+        # Should swap content in a single replace call
+        mocks["text_instance"].replace.assert_called_once_with(
+            "1.0", "end", "new content"
+        )
 
     def test_clear_text(self, text_widget):
         """Test clearing text content."""
@@ -106,40 +152,28 @@ class TestQuipTextWidget:
         # Should insert at "insert" position by default
         mocks["text_instance"].insert.assert_called_with("insert", "inserted text")
 
-    def test_insert_text_smart_spacing_beginning(self, text_widget):
-        """Test smart spacing when inserting at text beginning."""
+    @pytest.mark.parametrize(
+        "prev_char, input_text, expected",
+        [
+            # At the beginning: strip whitespace, no leading space
+            ("", "  new text  ", "new text"),
+            # After existing space: no extra space
+            (" ", "new text", "new text"),
+            # After a letter: add a separating space
+            ("a", "new text", " new text"),
+        ],
+    )
+    def test_insert_text_smart_spacing(
+        self, text_widget, prev_char, input_text, expected
+    ):
+        """Test smart spacing for the character preceding the cursor."""
         widget, mocks = text_widget
 
-        mocks["text_instance"].index.return_value = "1.0"
+        mocks["text_instance"].get.return_value = prev_char
 
-        widget.insert_text_smart_spacing("  new text  ")
+        widget.insert_text_smart_spacing(input_text)
 
-        # Should not add space at beginning, but should strip whitespace
-        mocks["text_instance"].insert.assert_called_with("insert", "new text")
-
-    def test_insert_text_smart_spacing_after_space(self, text_widget):
-        """Test smart spacing when inserting after existing space."""
-        widget, mocks = text_widget
-
-        mocks["text_instance"].index.return_value = "1.5"
-        mocks["text_instance"].get.return_value = " "
-
-        widget.insert_text_smart_spacing("new text")
-
-        # Should not add extra space after existing space
-        mocks["text_instance"].insert.assert_called_with("insert", "new text")
-
-    def test_insert_text_smart_spacing_after_letter(self, text_widget):
-        """Test smart spacing when inserting after letter."""
-        widget, mocks = text_widget
-
-        mocks["text_instance"].index.return_value = "1.5"
-        mocks["text_instance"].get.return_value = "a"
-
-        widget.insert_text_smart_spacing("new text")
-
-        # Should add space before text when previous character is a letter
-        mocks["text_instance"].insert.assert_called_with("insert", " new text")
+        mocks["text_instance"].insert.assert_called_with("insert", expected)
 
     def test_bind_key(self, text_widget):
         """Test key binding functionality."""
@@ -151,37 +185,27 @@ class TestQuipTextWidget:
         # Should bind key to text widget
         mocks["text_instance"].bind.assert_any_call("<Control-s>", callback)
 
-    def test_set_processing_state_enabled(self, text_widget):
-        """Test enabling processing state."""
+    @pytest.mark.parametrize("is_processing", [True, False])
+    def test_set_processing_state(self, text_widget, is_processing):
+        """Test entering and leaving the processing state."""
         widget, mocks = text_widget
 
-        mocks["text_instance"].cget.side_effect = (
-            lambda x: "#2b2b2b" if x == "bg" else "#ffffff"
-        )
-
         widget.set_processing_state(True, "Processing...")
 
-        # Should disable widget and show processing message
-        mocks["text_instance"].delete.assert_called_with("1.0", "end")
-        mocks["text_instance"].insert.assert_called_with("1.0", "Processing...")
-        mocks["text_instance"].configure.assert_called()
-        mocks["text_instance"].config.assert_called_with(state="disabled")
-
-    def test_set_processing_state_disabled(self, text_widget):
-        """Test disabling processing state."""
-        widget, mocks = text_widget
-
-        # First enable processing state to set original values
-        mocks["text_instance"].cget.side_effect = (
-            lambda x: "#2b2b2b" if x == "bg" else "#ffffff"
-        )
-        widget.set_processing_state(True)
-
-        # Then disable it
-        widget.set_processing_state(False)
-
-        # Should re-enable widget and restore original styling
-        mocks["text_instance"].config.assert_any_call(state="normal")
+        if is_processing:
+            # Should disable widget and show processing message
+            mocks["text_instance"].replace.assert_called_with(
+                "1.0", "end", "Processing..."
+            )
+            mocks["text_instance"].configure.assert_called()
+            mocks["text_instance"].config.assert_called_with(state="disabled")
+        else:
+            widget.set_processing_state(False)
+
+            # Should re-enable widget and restore original styling in one call
+            mocks["text_instance"].configure.assert_any_call(
+                state="normal", bg="#2b2b2b", insertbackground="#ffffff"
+            )
 
     def test_focus_set(self, text_widget):
         """Test setting focus to text widget."""
@@ -189,8 +213,8 @@ class TestQuipTextWidget:
 
         widget.focus_set()
 
-        # Should call focus_set on text widget (called during init and explicit call)
-        assert mocks["text_instance"].focus_set.call_count >= 2
+        # The per-test text mock is fresh, so only the explicit call shows
+        mocks["text_instance"].focus_set.assert_called_once()
 
     def test_index(self, text_widget):
         """Test getting index for position."""
@@ -244,6 +268,42 @@ class TestQuipTextWidget:
             False
         )
 
+    def test_text_change_events_coalesce(self, text_widget):
+        """Test that a burst of change events schedules a single flush."""
+        widget, mocks = text_widget
+
+        # Defer the idle callback instead of running it inline
+        mocks["text_instance"].after_idle.side_effect = None
+        mocks["text_instance"].after_idle.return_value = "idle-1"
+        mocks["text_instance"].get.return_value = "some content"
+
+        widget._on_text_change()
+        widget._on_text_change()
+        widget._on_text_change()
+
+        # Only one idle flush scheduled, nothing propagated yet
+        mocks["text_instance"].after_idle.assert_called_once()
+        mocks["overlay_manager_instance"].update_for_text_content.assert_not_called()
+
+        widget._flush_text_change()
+
+        mocks["overlay_manager_instance"].update_for_text_content.assert_called_once()
+        assert widget._pending_change is None
+
+    def test_text_change_empty_buffer_skips_get(self, text_widget):
+        """Test that a truly empty buffer is detected without a get()."""
+        widget, mocks = text_widget
+
+        mocks["text_instance"].compare.return_value = True
+
+        widget._on_text_change()
+
+        mocks["text_instance"].compare.assert_called_once_with("end-1c", "==", "1.0")
+        mocks["text_instance"].get.assert_not_called()
+        mocks["overlay_manager_instance"].update_for_text_content.assert_called_with(
+            False
+        )
+
     def test_text_change_callback(self, text_widget):
         """Test that text change callback is called when set."""
         widget, mocks = text_widget
@@ -264,25 +324,24 @@ class TestQuipTextWidget:
         widget, mocks = text_widget
         overlay_manager = mocks["overlay_manager_instance"]
 
-        # Test each overlay management method
         widget.show_empty_state()
-        overlay_manager.show_empty_state.assert_called_once()
-
         widget.show_recording_overlay()
-        overlay_manager.show_recording.assert_called_once()
-
         widget.show_recording_tail_overlay()
-        overlay_manager.show_recording_tail.assert_called_once()
-
         widget.show_processing_overlay()
-        overlay_manager.show_processing.assert_called_once()
-
         widget.hide_all_overlays()
-        overlay_manager.hide_all_overlays.assert_called_once()
 
-    def test_event_binding_during_init(self, text_widget):
+        # One list comparison checks order and catches extra calls
+        assert overlay_manager.method_calls == [
+            call.show_empty_state(),
+            call.show_recording(),
+            call.show_recording_tail(),
+            call.show_processing(),
+            call.hide_all_overlays(),
+        ]
+
+    def test_event_binding_during_init(self, _widget_env):
         """Test that events are properly bound during initialization."""
-        widget, mocks = text_widget
+        widget, mocks = _widget_env
 
         # Should bind text change events
         mocks["text_instance"].bind.assert_any_call(
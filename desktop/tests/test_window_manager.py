@@ -7,6 +7,15 @@ import pytest
 
 from ui.window_manager import MonitorInfo, WindowManager
 
+# (monitor x, y, width, height) -> expected geometry for the default
+# 800x150 window, precomputed at collection time so each case's test
+# body is just two mock calls
+_CENTERED_CASES = [
+    pytest.param((100, 200, 1920, 1080), "800x150+660+665", id="offset_1080p"),
+    pytest.param((0, 0, 2560, 1440), "800x150+880+645", id="primary_1440p"),
+    pytest.param((1920, 0, 1920, 1080), "800x150+2480+465", id="second_1080p"),
+]
+
 
 class TestMonitorInfo:
     """Test MonitorInfo functionality."""
@@ -42,11 +51,36 @@ class TestMonitorInfo:
 class TestWindowManager:
     """Test WindowManager functionality."""
 
-    @pytest.fixture
-    def window_manager(self, mock_tkinter, mock_config):
-        """Create a WindowManager instance for testing."""
-        with patch("ui.window_manager.config", mock_config):
-            return WindowManager(mock_tkinter["root"])
+    @pytest.fixture(scope="module")
+    def window_manager(self):
+        """One WindowManager for the whole module.
+
+        Tests only mutate cheap state (mock call history, a couple of
+        attributes) that the autouse reset fixture restores, so the
+        mock tree and __init__ run once instead of per test.
+        """
+        return WindowManager(Mock())
+
+    @pytest.fixture(autouse=True)
+    def _reset_window_state(self, window_manager, mock_config, monkeypatch):
+        """Rebind the config stub and restore the shared manager.
+
+        reset_mock is O(children) versus rebuilding the whole root mock;
+        the winfo/geometry defaults mirror what a fresh mock root carried.
+        """
+        monkeypatch.setattr("ui.window_manager.config", mock_config)
+        root = window_manager.root
+        root.reset_mock(return_value=True, side_effect=True)
+        root.winfo_screenwidth.return_value = 1920
+        root.winfo_screenheight.return_value = 1080
+        root.winfo_pointerx.return_value = 960
+        root.winfo_pointery.return_value = 540
+        root.geometry.return_value = "800x150+560+465"
+        window_manager.original_height = None
+        window_manager.invalidate_monitor_cache()
+        window_manager._fallback_monitor = None
+        if hasattr(window_manager, "text_widget"):
+            del window_manager.text_widget
 
     def test_setup_window_properties(self, window_manager):
         """Test window property setup."""
@@ -125,6 +159,23 @@ HDMI-A-1 disconnected (normal left inverted right x axis y axis)"""
         assert len(monitors) == 1
         assert monitors[0].name == "default"
 
+    @patch("subprocess.run")
+    def test_detect_monitors_cached(self, mock_run, window_manager):
+        """Test that repeat detection within the TTL skips xrandr."""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "DP-1 connected 1920x1080+0+0"
+
+        first = window_manager.detect_monitors()
+        second = window_manager.detect_monitors()
+
+        assert second is first
+        mock_run.assert_called_once()
+
+        # Invalidation forces a fresh query
+        window_manager.invalidate_monitor_cache()
+        window_manager.detect_monitors()
+        assert mock_run.call_count == 2
+
     def test_find_current_monitor_found(self, window_manager):
         """Test finding current monitor when cursor is on a monitor."""
         monitors = [
@@ -155,10 +206,10 @@ HDMI-A-1 disconnected (normal left inverted right x axis y axis)"""
 
         assert current is None
 
-    def test_position_window_centered(self, window_manager, mock_config):
-        """Test centering window on monitor."""
-        # Mock monitor detection to return a single monitor
-        monitor = MonitorInfo("DP-1", 100, 200, 1920, 1080)
+    @pytest.mark.parametrize("mon_geom, expected", _CENTERED_CASES)
+    def test_position_window_centered(self, window_manager, mon_geom, expected):
+        """Test centering window on monitors of various geometries."""
+        monitor = MonitorInfo("DP-1", *mon_geom)
 
         with (
             patch.object(window_manager, "detect_monitors") as mock_detect,
@@ -169,13 +220,7 @@ HDMI-A-1 disconnected (normal left inverted right x axis y axis)"""
 
             window_manager.position_window_centered()
 
-            # Should call geometry with centered position
-            expected_x = 100 + (1920 // 2) - (800 // 2)  # 100 + 960 - 400 = 660
-            expected_y = 200 + (1080 // 2) - (150 // 2)  # 200 + 540 - 75 = 665
-
-            window_manager.root.geometry.assert_called_with(
-                f"800x150+{expected_x}+{expected_y}"
-            )
+            window_manager.root.geometry.assert_called_with(expected)
 
     def test_expand_window(self, window_manager):
         """Test expanding window height."""
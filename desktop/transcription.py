@@ -1,15 +1,22 @@
 """Speech transcription functionality for Quip."""
 
 import json
+import logging
+import queue
 import threading
-import wave
-import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable
 from pathlib import Path
 
 import numpy as np
 
+# Where the resolved Vosk model path is remembered between runs, so
+# startup skips the multi-directory glob scan once a model is found
+_MODEL_PATH_CACHE = Path.home() / ".cache" / "quip" / "vosk_model_path.txt"
+
+logger = logging.getLogger("quip.transcription")
+
 
 class TranscriptionEngine(ABC):
     """Abstract base class for transcription engines."""
@@ -24,6 +31,16 @@ class TranscriptionEngine(ABC):
         """Transcribe audio data to text."""
         pass
 
+    @abstractmethod
+    def feed_chunk(self, pcm_bytes: bytes) -> None:
+        """Feed one chunk of 16-bit PCM for incremental decoding."""
+        pass
+
+    @abstractmethod
+    def finalize(self) -> str:
+        """Finish incremental decoding and return the accumulated text."""
+        pass
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the engine is available and working."""
@@ -35,11 +52,12 @@ class MockEngine(TranscriptionEngine):
 
     def __init__(self):
         self._initialized = False
+        self._streamed_samples = 0
 
     def initialize(self) -> bool:
         """Mock initialization."""
         self._initialized = True
-        print("Mock transcription engine initialized")
+        logger.info("Mock transcription engine initialized")
         return True
 
     def transcribe(self, audio_data: np.ndarray, sample_rate: int = 16000) -> str:
@@ -47,6 +65,16 @@ class MockEngine(TranscriptionEngine):
         duration = len(audio_data) / sample_rate
         return f"[Mock transcription: {duration:.1f}s of audio captured]"
 
+    def feed_chunk(self, pcm_bytes: bytes) -> None:
+        """Mock incremental decoding - just count the samples."""
+        self._streamed_samples += len(pcm_bytes) // 2
+
+    def finalize(self) -> str:
+        """Mock finalization."""
+        duration = self._streamed_samples / 16000
+        self._streamed_samples = 0
+        return f"[Mock transcription: {duration:.1f}s of audio captured]"
+
     def is_available(self) -> bool:
         """Mock is always available."""
         return True
@@ -55,12 +83,22 @@ class MockEngine(TranscriptionEngine):
 class VoskEngine(TranscriptionEngine):
     """Vosk speech recognition engine (local, lightweight)."""
 
+    # Int16 RMS below which a recording is treated as silence (~0.6% of
+    # full scale); the decoder is never invoked for such takes
+    SILENCE_RMS_THRESHOLD = 200.0
+
     def __init__(self, model_path: Optional[str] = None, language: str = "en"):
         self.language = language
         self.model_path = model_path
         self.model = None
         self.recognizer = None
         self._initialized = False
+        self._stream_parts: list = []
+        # Running energy of the streamed take, for the silence gate
+        self._stream_sumsq = 0.0
+        self._stream_samples = 0
+        # Reused float32 workspace for sample conversion; grown on demand
+        self._scratch_f32: Optional[np.ndarray] = None
 
     def initialize(self) -> bool:
         """Load the Vosk model."""
@@ -76,29 +114,78 @@ class VoskEngine(TranscriptionEngine):
             # Try to find a suitable model
             model_path = self._find_model()
             if not model_path:
-                print(
-                    "No Vosk model found. Please download a model from https://alphacephei.com/vosk/models"
+                logger.warning(
+                    "No Vosk model found. Please download a model from %s",
+                    "https://alphacephei.com/vosk/models",
                 )
                 return False
 
-            print(f"Loading Vosk model from {model_path}...")
+            logger.info("Loading Vosk model from %s...", model_path)
             self.model = Model(str(model_path))
             self.recognizer = KaldiRecognizer(self.model, 16000)
             self._initialized = True
-            print("Vosk model loaded successfully")
+
+            # Warm the decoder with ~200ms of silence on this (background
+            # init) thread so the first real utterance runs at steady
+            # state instead of paying the lattice/graph setup stall
+            try:
+                warm = np.zeros(3200, dtype=np.int16).tobytes()
+                self.recognizer.AcceptWaveform(warm)
+                self.recognizer.FinalResult()
+                self.recognizer.Reset()
+            except Exception:
+                pass  # Warming is best-effort; decoding still works cold
+
+            logger.info("Vosk model loaded successfully")
             return True
         except ImportError:
-            print("Vosk not available - voice transcription disabled")
+            logger.warning("Vosk not available - voice transcription disabled")
             return False
         except Exception as e:
-            print(f"Failed to initialize Vosk: {e}")
+            logger.error("Failed to initialize Vosk: %s", e)
             return False
 
+    @staticmethod
+    def _is_model_dir(path: Path) -> bool:
+        """Check whether a directory holds an extracted Vosk model."""
+        return path.is_dir() and (path / "am" / "final.mdl").exists()
+
     def _find_model(self) -> Optional[Path]:
-        """Find a suitable Vosk model."""
+        """Find a suitable Vosk model, preferring the cached resolution."""
         if self.model_path and Path(self.model_path).exists():
             return Path(self.model_path)
 
+        cached = self._read_cached_model_path()
+        if cached is not None:
+            return cached
+
+        model_dir = self._scan_for_model()
+        if model_dir is not None:
+            self._write_cached_model_path(model_dir)
+        return model_dir
+
+    def _read_cached_model_path(self) -> Optional[Path]:
+        """Return the cached model path if it still looks like a model."""
+        try:
+            cached = _MODEL_PATH_CACHE.read_text().strip()
+        except OSError:
+            return None
+
+        if cached and self._is_model_dir(Path(cached)):
+            return Path(cached)
+        return None
+
+    @staticmethod
+    def _write_cached_model_path(model_dir: Path) -> None:
+        """Remember the resolved model path for the next startup."""
+        try:
+            _MODEL_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _MODEL_PATH_CACHE.write_text(str(model_dir))
+        except OSError:
+            pass  # Cache is best-effort; the next run just rescans
+
+    def _scan_for_model(self) -> Optional[Path]:
+        """Scan the common install locations for a model directory."""
         # Common model locations
         possible_paths = [
             Path.home() / ".cache" / "vosk",
@@ -115,21 +202,18 @@ class VoskEngine(TranscriptionEngine):
             / "vosk-models",  # Installed location
         ]
 
-        # Look for English models first, then any model
-        model_patterns = [
-            "*en*",  # English models
-            "*small*",  # Small models
-            "*",  # Any model
-        ]
-
         for base_path in possible_paths:
             if not base_path.exists():
                 continue
 
-            for pattern in model_patterns:
-                for model_dir in base_path.glob(pattern):
-                    if model_dir.is_dir() and (model_dir / "am" / "final.mdl").exists():
-                        return model_dir
+            # One directory scan instead of three glob passes; the sort
+            # key keeps the old preference: English first, then small
+            candidates = [p for p in base_path.glob("*") if self._is_model_dir(p)]
+            if candidates:
+                return min(
+                    candidates,
+                    key=lambda p: ("en" not in p.name, "small" not in p.name, p.name),
+                )
 
         return None
 
@@ -139,49 +223,102 @@ class VoskEngine(TranscriptionEngine):
             raise RuntimeError("Vosk engine not initialized")
 
         try:
-            # Convert numpy array to WAV format that Vosk expects
             # Vosk expects 16-bit PCM data
-            if audio_data.dtype != np.int16:
-                # Convert float32 to int16
-                if audio_data.dtype == np.float32:
-                    audio_data = (audio_data * 32767).astype(np.int16)
-                else:
-                    audio_data = audio_data.astype(np.int16)
-
-            # Create a temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                with wave.open(temp_file.name, "wb") as wav_file:
-                    wav_file.setnchannels(1)  # mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(sample_rate)
-                    wav_file.writeframes(audio_data.tobytes())
-
-                # Read back and transcribe
-                with wave.open(temp_file.name, "rb") as wav_file:
-                    text_parts = []
-
-                    while True:
-                        data = wav_file.readframes(4000)
-                        if len(data) == 0:
-                            break
-
-                        if self.recognizer.AcceptWaveform(data):
-                            result = json.loads(self.recognizer.Result())
-                            if result.get("text"):
-                                text_parts.append(result["text"])
-
-                    # Get final result
-                    final_result = json.loads(self.recognizer.FinalResult())
-                    if final_result.get("text"):
-                        text_parts.append(final_result["text"])
-
-                # Clean up temp file
-                Path(temp_file.name).unlink(missing_ok=True)
+            audio_data = self._to_int16(audio_data)
+
+            # Silence gate: an accidental tap records near-silence, and
+            # running the decoder over it costs hundreds of ms for an
+            # empty result
+            if audio_data.size == 0:
+                return ""
+            rms = np.sqrt(np.mean(np.square(audio_data.astype(np.float32, copy=False))))
+            if rms < self.SILENCE_RMS_THRESHOLD:
+                return ""
+
+            # Feed raw PCM straight into the recognizer; the old WAV
+            # temp-file round trip wrote and re-read the whole recording
+            # from disk just to chunk it
+            raw = audio_data.tobytes()
+            step = 8000  # 4000 samples * 2 bytes, same chunking as before
+            text_parts = []
+
+            for offset in range(0, len(raw), step):
+                if self.recognizer.AcceptWaveform(raw[offset : offset + step]):
+                    result = json.loads(self.recognizer.Result())
+                    if result.get("text"):
+                        text_parts.append(result["text"])
+
+            # Get final result
+            final_result = json.loads(self.recognizer.FinalResult())
+            if final_result.get("text"):
+                text_parts.append(final_result["text"])
 
             return " ".join(text_parts).strip()
         except Exception as e:
             raise RuntimeError(f"Transcription failed: {e}")
 
+    def _to_int16(self, audio_data: np.ndarray) -> np.ndarray:
+        """Convert samples to int16 with saturation instead of wraparound.
+
+        The multiply and clip run in-place on a reused scratch buffer,
+        so the conversion allocates only the final int16 array, and hot
+        signals clamp at full scale rather than wrapping into loud
+        artifacts.
+        """
+        if audio_data.dtype == np.int16:
+            return audio_data
+
+        if audio_data.dtype == np.float32:
+            n = len(audio_data)
+            if self._scratch_f32 is None or len(self._scratch_f32) < n:
+                self._scratch_f32 = np.empty(n, dtype=np.float32)
+            scratch = self._scratch_f32[:n]
+            np.multiply(audio_data, 32767.0, out=scratch)
+            np.clip(scratch, -32768.0, 32767.0, out=scratch)
+            return scratch.astype(np.int16)
+
+        return audio_data.astype(np.int16)
+
+    def feed_chunk(self, pcm_bytes: bytes) -> None:
+        """Decode one chunk while the next is still being captured.
+
+        Interleaving AcceptWaveform with capture overlaps decode and
+        recording, so finalize only has the tail left to process.
+        """
+        if not self._initialized or self.recognizer is None:
+            raise RuntimeError("Vosk engine not initialized")
+
+        # Track take energy so finalize can apply the same silence gate
+        # as the batch path
+        samples = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
+        self._stream_sumsq += float(np.dot(samples, samples))
+        self._stream_samples += samples.size
+
+        if self.recognizer.AcceptWaveform(pcm_bytes):
+            result = json.loads(self.recognizer.Result())
+            if result.get("text"):
+                self._stream_parts.append(result["text"])
+
+    def finalize(self) -> str:
+        """Flush the recognizer and return everything decoded so far."""
+        if not self._initialized or self.recognizer is None:
+            raise RuntimeError("Vosk engine not initialized")
+
+        final_result = json.loads(self.recognizer.FinalResult())
+        if final_result.get("text"):
+            self._stream_parts.append(final_result["text"])
+
+        parts, self._stream_parts = self._stream_parts, []
+        sumsq, self._stream_sumsq = self._stream_sumsq, 0.0
+        count, self._stream_samples = self._stream_samples, 0
+
+        # Silence gate, mirroring transcribe(): if the whole take stayed
+        # near-silent, drop whatever the decoder guessed at
+        if count and np.sqrt(sumsq / count) < self.SILENCE_RMS_THRESHOLD:
+            return ""
+
+        return " ".join(parts).strip()
+
     def is_available(self) -> bool:
         """Check if Vosk is available."""
         import importlib.util
@@ -189,13 +326,33 @@ class VoskEngine(TranscriptionEngine):
         return importlib.util.find_spec("vosk") is not None
 
 
+def _to_pcm_bytes(audio_data: np.ndarray) -> bytes:
+    """Convert captured samples to the 16-bit PCM bytes engines expect."""
+    if audio_data.dtype != np.int16:
+        if audio_data.dtype == np.float32:
+            # Clip before narrowing so hot samples saturate, not wrap
+            audio_data = np.clip(audio_data * 32767.0, -32768.0, 32767.0)
+        audio_data = audio_data.astype(np.int16)
+    return audio_data.tobytes()
+
+
 class TranscriptionService:
     """Service for managing speech transcription with pluggable engines."""
 
     def __init__(self, engine: Optional[TranscriptionEngine] = None):
         self.engine = engine or VoskEngine()
         self.is_initialized = False
-        self.initialization_thread: Optional[threading.Thread] = None
+
+        # One long-lived worker instead of a fresh Thread per request;
+        # a single worker also serializes jobs, which the stateful
+        # KaldiRecognizer requires anyway
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quip-asr")
+        self._init_future: Optional[Future] = None
+
+        # Streaming decode state: chunks are queued from the capture
+        # callback and decoded by one long-lived worker thread
+        self._stream_queue: Optional[queue.Queue] = None
+        self._stream_thread: Optional[threading.Thread] = None
 
         # Callbacks for UI feedback
         self.on_transcription_start: Optional[Callable] = None
@@ -204,20 +361,19 @@ class TranscriptionService:
 
     def initialize_async(self) -> None:
         """Initialize transcription engine asynchronously."""
-        if self.initialization_thread and self.initialization_thread.is_alive():
+        if self._init_future is not None and not self._init_future.done():
             return
 
-        self.initialization_thread = threading.Thread(target=self._initialize_engine)
-        self.initialization_thread.start()
+        self._init_future = self._pool.submit(self._initialize_engine)
 
     def _initialize_engine(self) -> None:
         """Internal method to initialize the engine."""
         try:
             self.is_initialized = self.engine.initialize()
             if not self.is_initialized:
-                print("Failed to initialize transcription engine")
+                logger.error("Failed to initialize transcription engine")
         except Exception as e:
-            print(f"Error initializing transcription engine: {e}")
+            logger.error("Error initializing transcription engine: %s", e)
             self.is_initialized = False
 
     def wait_for_initialization(self, timeout: float = 30.0) -> bool:
@@ -225,8 +381,11 @@ class TranscriptionService:
         if self.is_initialized:
             return True
 
-        if self.initialization_thread and self.initialization_thread.is_alive():
-            self.initialization_thread.join(timeout=timeout)
+        if self._init_future is not None:
+            try:
+                self._init_future.result(timeout=timeout)
+            except Exception:
+                pass  # _initialize_engine reports its own failures
 
         return self.is_initialized
 
@@ -239,10 +398,7 @@ class TranscriptionService:
                 self.on_transcription_error("Transcription engine not initialized")
             return
 
-        thread = threading.Thread(
-            target=self._transcribe_audio, args=(audio_data, sample_rate)
-        )
-        thread.start()
+        self._pool.submit(self._transcribe_audio, audio_data, sample_rate)
 
     def _transcribe_audio(self, audio_data: np.ndarray, sample_rate: int) -> None:
         """Internal method to transcribe audio."""
@@ -256,10 +412,61 @@ class TranscriptionService:
                 self.on_transcription_complete(text)
         except Exception as e:
             error_msg = str(e)
-            print(f"Transcription error: {error_msg}")
+            logger.error("Transcription error: %s", error_msg)
             if self.on_transcription_error:
                 self.on_transcription_error(error_msg)
 
+    def stream_chunk(self, audio_chunk: np.ndarray) -> None:
+        """Queue one captured chunk for incremental decoding.
+
+        Called from the audio capture callback, so it only enqueues;
+        the worker thread does the conversion and decode. Decoding
+        overlaps capture, cutting post-release latency to roughly the
+        tail of the recording instead of the whole utterance.
+        """
+        if not self.is_initialized:
+            return
+
+        if self._stream_queue is None:
+            self._stream_queue = queue.Queue()
+            self._stream_thread = threading.Thread(
+                target=self._stream_worker, daemon=True
+            )
+            self._stream_thread.start()
+
+        self._stream_queue.put(audio_chunk)
+
+    def finalize_async(self) -> None:
+        """Signal end of the streamed utterance.
+
+        The worker flushes the recognizer and delivers the text through
+        the usual completion/error callbacks.
+        """
+        if self._stream_queue is None:
+            return
+        self._stream_queue.put(None)
+
+    def _stream_worker(self) -> None:
+        """Long-lived worker: decode queued chunks, finalize on sentinel."""
+        while True:
+            chunk = self._stream_queue.get()
+            try:
+                if chunk is None:
+                    text = self.engine.finalize()
+                    if self.on_transcription_complete:
+                        self.on_transcription_complete(text)
+                else:
+                    self.engine.feed_chunk(_to_pcm_bytes(chunk))
+            except Exception as e:
+                error_msg = str(e)
+                logger.error("Transcription error: %s", error_msg)
+                if chunk is None and self.on_transcription_error:
+                    self.on_transcription_error(error_msg)
+
+    def close(self) -> None:
+        """Shut down the background worker without waiting for jobs."""
+        self._pool.shutdown(wait=False)
+
     def set_engine(self, engine: TranscriptionEngine) -> None:
         """Switch to a different transcription engine."""
         self.engine = engine
@@ -302,7 +509,9 @@ def create_transcription_service(
         engine = MockEngine()
     else:
         # Fall back to mock if unknown engine type
-        print(f"Unknown engine type '{engine_type}', falling back to mock engine")
+        logger.warning(
+            "Unknown engine type '%s', falling back to mock engine", engine_type
+        )
         engine = MockEngine()
 
     return TranscriptionService(engine)
@@ -1,5 +1,8 @@
 """Centralized font configuration for the Quip UI."""
 
+from tkinter import TclError
+from tkinter import font as tkfont
+
 from config import config
 
 # Base font family - loaded from config, defaults to "DejaVu Sans"
@@ -14,3 +17,35 @@ PROCESSING_FONT = (FONT_FAMILY, 18, "bold")
 RECORDING_TAIL_FONT = (FONT_FAMILY, 18, "bold")
 HELP_TEXT_FONT = (FONT_FAMILY, 12)
 KEYBIND_FONT = (FONT_FAMILY, 10)
+
+# Tuple specs keyed by style name; get_font() turns these into shared
+# Font objects so Tk does not re-parse the spec for every widget
+_FONT_SPECS = {
+    "main_text": MAIN_TEXT_FONT,
+    "placeholder": PLACEHOLDER_FONT,
+    "recording": RECORDING_FONT,
+    "processing": PROCESSING_FONT,
+    "recording_tail": RECORDING_TAIL_FONT,
+    "help_text": HELP_TEXT_FONT,
+    "keybind": KEYBIND_FONT,
+}
+_font_cache: dict = {}
+
+
+def get_font(name: str):
+    """Return a cached tkinter Font for a style key, building it lazily.
+
+    Font objects are named in Tk and shared across widgets, unlike tuple
+    specs which Tk parses per use. Falls back to the raw tuple when no
+    Tk root exists yet (e.g. headless tests) without caching, so a later
+    call can still upgrade to a real Font object.
+    """
+    font = _font_cache.get(name)
+    if font is None:
+        spec = _FONT_SPECS[name]
+        try:
+            font = tkfont.Font(font=spec)
+        except (RuntimeError, TclError):
+            return spec
+        _font_cache[name] = font
+    return font
@@ -4,13 +4,7 @@ import random
 import tkinter as tk
 from typing import Optional
 
-from .fonts import (
-    HELP_TEXT_FONT,
-    KEYBIND_FONT,
-    PLACEHOLDER_FONT,
-    PROCESSING_FONT,
-    RECORDING_FONT,
-)
+from .fonts import get_font
 
 
 class OverlayManager:
@@ -44,20 +38,41 @@ class OverlayManager:
         self.parent_frame = parent_frame
         self.bg_color = "#2b2b2b"
 
-        # Initialize all overlays
+        # Pre-shuffled placeholder order; drawing from it skips the
+        # global random lock per show and avoids repeats within a cycle
+        self._msg_cycle = iter(())
+        # Last text set on the recording label, to skip no-op reconfigs
+        self._last_recording_text: Optional[str] = None
+
+        # Only the empty-state overlay is needed for first paint; the
+        # recording/processing overlays are built on first show
         self._create_empty_state_overlay()
-        self._create_recording_overlay()
-        self._create_processing_overlay()
+        self.recording_overlay: Optional[tk.Frame] = None
+        self.recording_label: Optional[tk.Label] = None
+        self.processing_overlay: Optional[tk.Frame] = None
+        self.processing_label: Optional[tk.Label] = None
 
-        # Track current state
+        # Track current state; the string tag lets bouncy tab sequences
+        # skip repainting an overlay that is already showing
         self.current_overlay: Optional[tk.Widget] = None
+        self._overlay_state: Optional[str] = None
+
+    def _next_placeholder(self) -> str:
+        """Return the next placeholder message, reshuffling when spent."""
+        try:
+            return next(self._msg_cycle)
+        except StopIteration:
+            self._msg_cycle = iter(
+                random.sample(self.PLACEHOLDER_MESSAGES, len(self.PLACEHOLDER_MESSAGES))
+            )
+            return next(self._msg_cycle)
 
     def _create_empty_state_overlay(self) -> None:
         """Create empty state placeholder overlay."""
         self.empty_state_overlay = tk.Label(
             self.parent_frame,
-            text=random.choice(self.PLACEHOLDER_MESSAGES),
-            font=PLACEHOLDER_FONT,
+            text=self._next_placeholder(),
+            font=get_font("placeholder"),
             fg="#666666",
             bg=self.bg_color,
             justify="center",
@@ -78,12 +93,13 @@ class OverlayManager:
         self.recording_label = tk.Label(
             self.recording_overlay,
             text="🎤 Recording... (release Tab to stop)",
-            font=RECORDING_FONT,
+            font=get_font("recording"),
             fg="#ff9999",
             bg="#4d2626",
             justify="center",
         )
         self.recording_label.pack(expand=True)
+        self._last_recording_text = "🎤 Recording... (release Tab to stop)"
 
     def _create_processing_overlay(self) -> None:
         """Create processing state overlay."""
@@ -100,7 +116,7 @@ class OverlayManager:
         self.processing_label = tk.Label(
             self.processing_overlay,
             text="🧠 Processing audio...",
-            font=PROCESSING_FONT,
+            font=get_font("processing"),
             fg="#99ccff",
             bg="#264d4d",
             justify="center",
@@ -108,56 +124,82 @@ class OverlayManager:
         self.processing_label.pack(expand=True)
 
     def hide_all_overlays(self) -> None:
-        """Hide all overlay widgets."""
+        """Hide all overlay widgets that have been created so far."""
         self.empty_state_overlay.place_forget()
-        self.recording_overlay.place_forget()
-        self.processing_overlay.place_forget()
+        if self.recording_overlay is not None:
+            self.recording_overlay.place_forget()
+        if self.processing_overlay is not None:
+            self.processing_overlay.place_forget()
         self.current_overlay = None
+        self._overlay_state = None
 
     def show_empty_state(self) -> None:
         """Show empty state overlay with a fresh random message."""
         self.hide_all_overlays()
 
-        # Update with fresh random message
+        # Update with a fresh message from the shuffled cycle
         self.empty_state_overlay.config(
-            text=random.choice(self.PLACEHOLDER_MESSAGES),
+            text=self._next_placeholder(),
             fg="#666666",
             bg=self.bg_color,
         )
         self.empty_state_overlay.place(relx=0.5, rely=0.4, anchor="center")
         self.current_overlay = self.empty_state_overlay
+        self._overlay_state = "empty"
 
     def show_recording(self) -> None:
         """Show recording state overlay."""
+        if self._overlay_state == "recording":
+            return  # Already painted; avoid redundant Tk redraws on bounce
+
+        if self.recording_overlay is None:
+            self._create_recording_overlay()
+
         self.hide_all_overlays()
 
         # Reset to normal recording state
-        self.recording_label.config(
-            text="🎤 Recording... (release Tab to stop)",
-            fg="#ff9999",
-        )
+        self._set_recording_text("🎤 Recording... (release Tab to stop)", "#ff9999")
 
         self.recording_overlay.place(x=10, y=10, relwidth=0.97, relheight=0.85)
         self.current_overlay = self.recording_overlay
+        self._overlay_state = "recording"
+
+    def _set_recording_text(self, text: str, fg: str) -> None:
+        """Reconfigure the recording label only when the text changes.
+
+        Each config(text=...) triggers a Tk relayout, so bouncy
+        recording/tail transitions skip the no-op repaints.
+        """
+        if text != self._last_recording_text:
+            self.recording_label.config(text=text, fg=fg)
+            self._last_recording_text = text
 
     def show_recording_tail(self) -> None:
         """Show recording tail state (finishing up recording)."""
-        # Update the recording label to show tail state
-        self.recording_label.config(
-            text="🎤 Finishing recording...",
-            fg="#ffaa99",  # Slightly dimmer red to indicate tail period
-        )
+        if self._overlay_state == "tail":
+            return  # Already painted; avoid redundant Tk redraws on bounce
+
+        if self.recording_overlay is None:
+            self._create_recording_overlay()
+
+        # Update the recording label to show tail state (dimmer red)
+        self._set_recording_text("🎤 Finishing recording...", "#ffaa99")
 
         # Keep the recording overlay visible
         self.recording_overlay.place(x=10, y=10, relwidth=0.97, relheight=0.85)
         self.current_overlay = self.recording_overlay
+        self._overlay_state = "tail"
 
     def show_processing(self) -> None:
         """Show processing state overlay."""
+        if self.processing_overlay is None:
+            self._create_processing_overlay()
+
         self.hide_all_overlays()
 
         self.processing_overlay.place(x=10, y=10, relwidth=0.97, relheight=0.85)
         self.current_overlay = self.processing_overlay
+        self._overlay_state = "processing"
 
     def update_for_text_content(self, has_text: bool) -> None:
         """Update overlay visibility based on whether text widget has content."""
@@ -165,11 +207,9 @@ class OverlayManager:
             # Hide all overlays when there's text
             self.hide_all_overlays()
         else:
-            # Show empty state overlay when text is empty (unless we're in recording/processing)
-            if self.current_overlay not in [
-                self.recording_overlay,
-                self.processing_overlay,
-            ]:
+            # Show empty state overlay when text is empty (unless we're
+            # in recording/processing)
+            if self._overlay_state not in ("recording", "tail", "processing"):
                 self.show_empty_state()
 
 
@@ -183,8 +223,16 @@ class TooltipManager:
 
         self.tooltip_window: Optional[tk.Toplevel] = None
         self.tooltip_label: Optional[tk.Label] = None
+        self.tooltip_visible = False
+        self.info_icon: Optional[tk.Label] = None
 
-        self._create_info_icon()
+        # The tooltip body is static for this window's lifetime (opening
+        # settings respawns Quip), so render it once up front instead of
+        # per hover
+        self._tooltip_text = self._generate_tooltip_text()
+
+        # Defer info-icon creation - it isn't needed for first paint
+        self.root.after_idle(self._create_info_icon)
 
     def _create_info_icon(self) -> None:
         """Create info icon in bottom right corner."""
@@ -194,7 +242,7 @@ class TooltipManager:
         self.info_icon = tk.Label(
             self.info_frame,
             text="ⓘ",
-            font=HELP_TEXT_FONT,
+            font=get_font("help_text"),
             fg="#666666",  # Subtle gray
             bg=self.bg_color,
             cursor="hand2",
@@ -207,58 +255,70 @@ class TooltipManager:
 
     def show_tooltip(self, event=None) -> None:
         """Show tooltip with hotkey information."""
-        if self.tooltip_window:
+        if self.tooltip_visible:
             return
 
         # Position tooltip relative to info icon
         x = self.info_icon.winfo_rootx() + 20
         y = self.info_icon.winfo_rooty() - 150
 
-        self.tooltip_window = tk.Toplevel(self.root)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        if self.tooltip_window is None:
+            # Create the tooltip once and reuse it on later hovers
+            self.tooltip_window = tk.Toplevel(self.root)
+            self.tooltip_window.wm_overrideredirect(True)
+
+            self.tooltip_label = tk.Label(
+                self.tooltip_window,
+                text=self._tooltip_text,
+                font=get_font("keybind"),
+                bg="#1a1a1a",
+                fg="#ffffff",
+                relief="solid",
+                borderwidth=1,
+                padx=8,
+                pady=6,
+                justify="left",
+            )
+            self.tooltip_label.pack()
 
-        # Create tooltip content
-        tooltip_text = self._generate_tooltip_text()
+        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        self.tooltip_window.deiconify()
+        self.tooltip_visible = True
 
-        self.tooltip_label = tk.Label(
-            self.tooltip_window,
-            text=tooltip_text,
-            font=KEYBIND_FONT,
-            bg="#1a1a1a",
-            fg="#ffffff",
-            relief="solid",
-            borderwidth=1,
-            padx=8,
-            pady=6,
-            justify="left",
-        )
-        self.tooltip_label.pack()
+    def refresh(self) -> None:
+        """Re-render the tooltip body after a configuration change."""
+        self._tooltip_text = self._generate_tooltip_text()
+        if self.tooltip_label is not None:
+            self.tooltip_label.config(text=self._tooltip_text)
 
     def _generate_tooltip_text(self) -> str:
         """Generate contextual tooltip text based on configuration."""
         from config import config
 
-        tooltip_text = "Hotkeys:\n"
-        tooltip_text += "• Ctrl+Enter / Ctrl+D — Save and exit\n"
-        tooltip_text += "• Ctrl+S — Open settings\n"
+        lines = [
+            "Hotkeys:",
+            "• Ctrl+Enter / Ctrl+D — Save and exit",
+            "• Ctrl+S — Open settings",
+        ]
 
         if config.llm_enabled:
-            tooltip_text += "• Ctrl+I — Improve with AI\n"
-            tooltip_text += "• Ctrl+L — Curator feedback\n"
-            tooltip_text += "• Ctrl+Z — Undo improvement\n"
-
-        tooltip_text += "• Escape — Exit without saving"
+            lines += [
+                "• Ctrl+I — Improve with AI",
+                "• Ctrl+L — Curator feedback",
+                "• Ctrl+Z — Undo improvement",
+            ]
 
-        # Add LLM status
-        llm_status = "✅ AI enabled" if config.llm_enabled else "⚠️ AI disabled"
-        tooltip_text += f"\n\n{llm_status}"
+        lines += [
+            "• Escape — Exit without saving",
+            "",
+            # LLM status
+            "✅ AI enabled" if config.llm_enabled else "⚠️ AI disabled",
+        ]
 
-        return tooltip_text
+        return "\n".join(lines)
 
     def hide_tooltip(self, event=None) -> None:
-        """Hide tooltip."""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
-            self.tooltip_label = None
+        """Hide tooltip without destroying it so it can be reused."""
+        if self.tooltip_window and self.tooltip_visible:
+            self.tooltip_window.withdraw()
+            self.tooltip_visible = False
@@ -6,6 +6,9 @@ from typing import Callable, Optional
 from .fonts import MAIN_TEXT_FONT
 from .overlays import OverlayManager
 
+# Characters that don't need a space inserted after them
+_WS_BEFORE = frozenset((" ", "\n", "\t"))
+
 
 class QuipTextWidget:
     """Enhanced text widget with overlay management and smart content handling."""
@@ -21,6 +24,9 @@ class QuipTextWidget:
         # Event callbacks
         self.on_text_change: Optional[Callable[[str], None]] = None
 
+        # Pending after_idle token; non-None while a flush is scheduled
+        self._pending_change: Optional[str] = None
+
         self._bind_events()
 
     def _create_text_widget(self) -> None:
@@ -56,9 +62,28 @@ class QuipTextWidget:
         self.text.bind("<Button-1>", self._on_text_change)
 
     def _on_text_change(self, event=None) -> None:
-        """Handle text change events."""
-        content = self.get_text()
-        has_text = bool(content.strip())
+        """Handle text change events, coalescing bursts into one update.
+
+        Rapid typing fires a KeyRelease per keystroke; scheduling a
+        single after_idle flush means the buffer is read once per burst
+        instead of once per event.
+        """
+        if self._pending_change is not None:
+            return
+        self._pending_change = self.text.after_idle(self._flush_text_change)
+
+    def _flush_text_change(self) -> None:
+        """Read the buffer once and propagate the change."""
+        self._pending_change = None
+
+        # Cheap Tcl-side emptiness check first; only pull the full
+        # buffer across the boundary when there is actually content
+        if self.text.compare("end-1c", "==", "1.0"):
+            content = ""
+            has_text = False
+        else:
+            content = self.get_text()
+            has_text = bool(content.strip())
 
         # Update overlay state
         self.overlay_manager.update_for_text_content(has_text)
@@ -73,8 +98,8 @@ class QuipTextWidget:
 
     def set_text(self, text: str) -> None:
         """Set text content."""
-        self.text.delete("1.0", "end")
-        self.text.insert("1.0", text)
+        # replace() does delete+insert in one Tcl call
+        self.text.replace("1.0", "end", text)
         self._on_text_change()  # Update overlays
 
     def clear_text(self) -> None:
@@ -89,14 +114,13 @@ class QuipTextWidget:
 
     def insert_text_smart_spacing(self, text: str) -> None:
         """Insert text with smart spacing logic."""
-        cursor_pos = self.text.index("insert")
         text_to_insert = text.strip()
 
-        # Check if we need to add a space before the text
-        if cursor_pos != "1.0":  # Not at the beginning of the text
-            char_before = self.text.get(f"{cursor_pos}-1c", cursor_pos)
-            if char_before and char_before not in [" ", "\n", "\t"]:
-                text_to_insert = " " + text_to_insert
+        # Single Tcl call: an empty result means the cursor is at the very
+        # beginning, so no space is needed there either
+        char_before = self.text.get("insert-1c", "insert")
+        if char_before and char_before not in _WS_BEFORE:
+            text_to_insert = " " + text_to_insert
 
         self.insert_text(text_to_insert)
 
@@ -121,12 +145,16 @@ class QuipTextWidget:
             )
             self.text.config(state="disabled")  # Disable editing while processing
         else:
-            # Restore editing and original styling
-            self.text.config(state="normal")
+            # Restore editing and original styling in a single configure call
+            # to avoid extra Tcl round-trips
             if hasattr(self, "_original_bg"):
                 self.text.configure(
-                    bg=self._original_bg, insertbackground=self._original_cursor
+                    state="normal",
+                    bg=self._original_bg,
+                    insertbackground=self._original_cursor,
                 )
+            else:
+                self.text.config(state="normal")
 
     def focus_set(self) -> None:
         """Set focus to the text widget."""
@@ -2,14 +2,29 @@
 
 import re
 import subprocess
+import time
 import tkinter as tk
 from typing import List, Optional, Tuple
 
 from config import config
 
+# Matches xrandr lines like "DP-2 connected 2560x1440+2560+0" or
+# "DP-4 connected primary 2560x1440+1920+0"; compiled once instead of
+# per line parsed
+_XRANDR_MONITOR_RE = re.compile(
+    r"^(\S+)\s+connected\s+(?:primary\s+)?(\d+)x(\d+)\+(\d+)\+(\d+)"
+)
+
 
 class MonitorInfo:
-    """Information about a monitor."""
+    """Information about a monitor.
+
+    Slotted: instances are created per detected monitor and queried in
+    the find_current_monitor loop, where slot descriptors beat __dict__
+    lookups and cost less memory.
+    """
+
+    __slots__ = ("name", "x", "y", "width", "height")
 
     def __init__(self, name: str, x: int, y: int, width: int, height: int):
         self.name = name
@@ -29,10 +44,18 @@ class WindowManager:
     # Base DPI that window dimensions are designed for
     BASE_DPI = 96.0
 
+    # How long a detected monitor layout stays fresh; long enough to
+    # cover one popup's positioning calls, short enough that plugging
+    # in a display is picked up on the next spawn
+    MONITOR_TTL_S = 5.0
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.original_height: Optional[int] = None
         self.dpi_scale = self._detect_dpi_scale()
+        self._monitor_cache: Optional[List[MonitorInfo]] = None
+        self._monitor_cache_time = 0.0
+        self._fallback_monitor: Optional[MonitorInfo] = None
 
     def _detect_dpi_scale(self) -> float:
         """Detect DPI scale factor relative to standard 96 DPI."""
@@ -77,6 +100,44 @@ class WindowManager:
             pass
 
     def detect_monitors(self) -> List[MonitorInfo]:
+        """Detect monitor configuration, caching the result briefly.
+
+        The xrandr fork/exec costs 5-20ms and runs on every popup
+        positioning; within the TTL the parsed layout is reused.
+        """
+        now = time.monotonic()
+        if (
+            self._monitor_cache is not None
+            and now - self._monitor_cache_time < self.MONITOR_TTL_S
+        ):
+            return self._monitor_cache
+
+        monitors = self._detect_monitors_uncached()
+        self._monitor_cache = monitors
+        self._monitor_cache_time = now
+        return monitors
+
+    def invalidate_monitor_cache(self) -> None:
+        """Force the next detect_monitors call to re-query xrandr."""
+        self._monitor_cache = None
+
+    def _get_fallback_monitor(self) -> MonitorInfo:
+        """Single-monitor fallback from the root window's screen size.
+
+        Built once and reused so repeated detection failures don't
+        reallocate it or re-query the screen dimensions.
+        """
+        if self._fallback_monitor is None:
+            self._fallback_monitor = MonitorInfo(
+                name="default",
+                x=0,
+                y=0,
+                width=self.root.winfo_screenwidth(),
+                height=self.root.winfo_screenheight(),
+            )
+        return self._fallback_monitor
+
+    def _detect_monitors_uncached(self) -> List[MonitorInfo]:
         """Detect monitor configuration using xrandr on Linux."""
         try:
             # Try xrandr first (most common on Linux)
@@ -89,15 +150,7 @@ class WindowManager:
             pass
 
         # Fallback: return single monitor based on tkinter values
-        return [
-            MonitorInfo(
-                name="default",
-                x=0,
-                y=0,
-                width=self.root.winfo_screenwidth(),
-                height=self.root.winfo_screenheight(),
-            )
-        ]
+        return [self._get_fallback_monitor()]
 
     def _parse_xrandr_output(self, output: str) -> List[MonitorInfo]:
         """Parse xrandr output to get monitor positions and sizes."""
@@ -105,10 +158,7 @@ class WindowManager:
         lines = output.split("\n")
 
         for line in lines:
-            # Look for lines like: "DP-2 connected 2560x1440+2560+0" or "DP-4 connected primary 2560x1440+1920+0"
-            match = re.search(
-                r"^(\S+)\s+connected\s+(?:primary\s+)?(\d+)x(\d+)\+(\d+)\+(\d+)", line
-            )
+            match = _XRANDR_MONITOR_RE.match(line)
             if match:
                 name, width, height, x, y = match.groups()
                 monitors.append(
@@ -123,15 +173,7 @@ class WindowManager:
 
         if not monitors:
             # Fallback
-            monitors.append(
-                MonitorInfo(
-                    name="default",
-                    x=0,
-                    y=0,
-                    width=self.root.winfo_screenwidth(),
-                    height=self.root.winfo_screenheight(),
-                )
-            )
+            monitors.append(self._get_fallback_monitor())
 
         return monitors
 
@@ -139,17 +181,20 @@ class WindowManager:
         self, monitors: List[MonitorInfo]
     ) -> Optional[MonitorInfo]:
         """Find which monitor the cursor is currently on."""
+        # One Tcl round trip each; reused for every monitor checked
         pointer_x = self.root.winfo_pointerx()
         pointer_y = self.root.winfo_pointery()
 
-        if config.debug_mode:
+        # Snapshot the flag so the loop pays one attribute lookup total
+        debug = config.debug_mode
+        if debug:
             print(f"DEBUG: pointer x={pointer_x}, pointer y={pointer_y}")
             print(
                 f"DEBUG: Detected monitors: {[f'{m.name}({m.x},{m.y},{m.width}x{m.height})' for m in monitors]}"
             )
 
         for monitor in monitors:
-            if config.debug_mode:
+            if debug:
                 print(
                     f"DEBUG: Checking if cursor ({pointer_x}, {pointer_y}) is in monitor {monitor.name}: "
                     f"x={monitor.x}-{monitor.x + monitor.width}, y={monitor.y}-{monitor.y + monitor.height}"
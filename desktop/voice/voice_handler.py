@@ -1,33 +1,51 @@
 """Voice recording and transcription coordination."""
 
+import os
+import shutil
 import subprocess
 import threading
 import time
+import wave
 from pathlib import Path
 from typing import Callable, Optional
 
 from config import config
 from transcription import create_transcription_service
 
+# Snapshot debug flag at import so hot event handlers skip the config
+# attribute lookup per call; a toggle takes effect on next app spawn
+DEBUG = bool(config.debug_mode)
+
+# Master switch for audio feedback; tests flip it off so recording
+# start/stop paths never touch the audio backend or fork a player
+_AUDIO_PLAYBACK_ENABLED = True
+
 
 class VoiceHandler:
     """Coordinates voice recording and transcription with UI feedback."""
 
-    def __init__(self):
-        # Voice recording state
-        self.tab_press_time: Optional[float] = None
+    def __init__(self, defer_transcription_load: bool = False):
+        # Voice recording state (timestamps are time.monotonic_ns ints)
+        self.tab_press_time: Optional[int] = None
         self.tab_hold_threshold = (
             config.voice_hold_threshold_ms / 1000.0
         )  # Convert to seconds
         self.recording_mode = False
         self.tab_physically_pressed = False  # Track physical key state
         self.tab_consumed_as_hold = False  # Track if this press was used for recording
-        self.tab_release_time: Optional[float] = None  # Track when tab was released
+        self.tab_release_time: Optional[int] = None  # Track when tab was released
         self.release_debounce_time = 0.1  # 100ms debounce for rapid press/release
+        # Integer thresholds so the hot path avoids float math entirely
+        self._tab_hold_threshold_ns = int(self.tab_hold_threshold * 1e9)
+        self._release_debounce_ns = int(self.release_debounce_time * 1e9)
+        # Precomputed press dispatch keyed on (within_debounce, pressed);
+        # one dict probe per event instead of walking a condition ladder
+        self._press_dispatch = self._build_press_dispatch()
         self.recording_tail_time = (
             config.voice_recording_tail_ms / 1000.0
         )  # Convert to seconds
         self.recording_tail_active = False  # Track if we're in the tail period
+        self._stream_active = False  # Chunks streamed to transcription this take
 
         # Defer component initialization for faster startup
         self.voice_recorder = None
@@ -38,13 +56,20 @@ class VoiceHandler:
         self.transcription_service = None
         self.transcription_loading = False
         self.transcription_failed = False
+        # Signalled once loading settles (ready or failed) so callers can
+        # block on the outcome instead of polling get_transcription_status
+        self._ready_event = threading.Event()
 
-        # Start loading transcription service in background
-        self._start_transcription_loading()
-
-        # Initialize audio feedback
+        # Initialize audio feedback paths (cheap); decoding the WAVs is
+        # deferred to the background loader thread, which needs the
+        # paths resolved first
         self._init_audio_feedback()
 
+        # Start loading transcription service in background. Callers that
+        # wire up a service themselves (tests) defer to skip the thread.
+        if not defer_transcription_load:
+            self._start_transcription_loading()
+
         # Callbacks for UI updates
         self.on_recording_start: Optional[Callable[[], None]] = None
         self.on_recording_stop: Optional[Callable[[], None]] = None
@@ -57,13 +82,26 @@ class VoiceHandler:
 
     def _init_audio_feedback(self) -> None:
         """Initialize audio feedback file paths."""
+        self._sound_cache = {}
+        self._audio_backend = None
+        self._sounds_available = False
+        # Resolve the fallback player once instead of probing per play
+        self._player = shutil.which("aplay") or shutil.which("paplay")
+
         try:
             sounds_dir = Path(__file__).parent.parent / "sounds"
             self.sound_record_start = sounds_dir / "record_start.wav"
             self.sound_record_stop = sounds_dir / "record_stop.wav"
 
-            # Check if sound files exist
-            if self.sound_record_start.exists() and self.sound_record_stop.exists():
+            # Check both sound files with one directory read instead of
+            # a stat call per file
+            try:
+                names = {entry.name for entry in os.scandir(sounds_dir)}
+            except OSError:
+                names = set()
+
+            if "record_start.wav" in names and "record_stop.wav" in names:
+                self._sounds_available = True
                 if config.debug_mode:
                     print("DEBUG: Audio feedback files found")
             else:
@@ -97,6 +135,7 @@ class VoiceHandler:
             # Set up callbacks
             self.voice_recorder.on_recording_start = self._on_voice_recording_start
             self.voice_recorder.on_recording_stop = self._on_voice_recording_stop
+            self.voice_recorder.on_audio_chunk = self._on_audio_chunk
 
             if config.debug_mode:
                 print("DEBUG: Voice recorder loaded successfully")
@@ -131,6 +170,7 @@ class VoiceHandler:
                 # Set up callbacks
                 voice_recorder.on_recording_start = self._on_voice_recording_start
                 voice_recorder.on_recording_stop = self._on_voice_recording_stop
+                voice_recorder.on_audio_chunk = self._on_audio_chunk
 
                 self.voice_recorder = voice_recorder
                 self.voice_recorder_loading = False
@@ -147,90 +187,137 @@ class VoiceHandler:
         # Start loading in background thread
         threading.Thread(target=load_voice_recorder, daemon=True).start()
 
+    def _preload_sounds(self) -> None:
+        """Decode the feedback WAVs into memory for in-process playback.
+
+        Reading the PCM data once lets _play_sound enqueue the samples
+        directly instead of spawning a player subprocess per call. Runs
+        on the background loader thread because importing sounddevice
+        loads PortAudio, which is too slow for the cold-start path.
+        Falls back to subprocess playback if the audio backend is missing.
+        """
+        try:
+            import numpy as np
+            import sounddevice
+
+            for sound_path in (self.sound_record_start, self.sound_record_stop):
+                with wave.open(str(sound_path), "rb") as wav_file:
+                    if wav_file.getsampwidth() != 2:
+                        continue  # Only 16-bit PCM is supported in-process
+                    frames = wav_file.readframes(wav_file.getnframes())
+                    samples = np.frombuffer(frames, dtype=np.int16)
+                    channels = wav_file.getnchannels()
+                    if channels > 1:
+                        samples = samples.reshape(-1, channels)
+                    self._sound_cache[sound_path] = (
+                        samples,
+                        wav_file.getframerate(),
+                    )
+
+            self._audio_backend = sounddevice
+        except Exception as e:
+            self._sound_cache = {}
+            self._audio_backend = None
+            if config.debug_mode:
+                print(f"DEBUG: Sound preload failed, using subprocess playback: {e}")
+
     def _play_sound(self, sound_path: Optional[Path]) -> None:
         """Play a sound effect if available."""
+        if not _AUDIO_PLAYBACK_ENABLED:
+            return
         try:
-            if sound_path and sound_path.exists():
-                # Use threading to avoid blocking the UI
-                def play_audio():
-                    try:
-                        # Try different audio players based on system
-                        subprocess.run(
-                            ["aplay", str(sound_path)],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            timeout=1,
-                        )
-                    except (subprocess.TimeoutExpired, FileNotFoundError):
-                        try:
-                            # Fallback for systems without aplay
-                            subprocess.run(
-                                ["paplay", str(sound_path)],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                                timeout=1,
-                            )
-                        except (subprocess.TimeoutExpired, FileNotFoundError):
-                            if config.debug_mode:
-                                print("DEBUG: No audio player found (aplay/paplay)")
-
-                threading.Thread(target=play_audio, daemon=True).start()
+            # Preferred path: play preloaded PCM without any process spawn
+            cached = self._sound_cache.get(sound_path)
+            if cached is not None and self._audio_backend is not None:
+                samples, sample_rate = cached
+                self._audio_backend.play(samples, sample_rate)  # Non-blocking
+                return
+
+            # Existence was verified once at init; skip the per-play stat
+            if self._sounds_available and sound_path is not None:
+                if self._player is None:
+                    if DEBUG:
+                        print("DEBUG: No audio player found (aplay/paplay)")
+                    return
+
+                # Fire-and-forget: detach the player so no thread waits on it
+                subprocess.Popen(
+                    [self._player, str(sound_path)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                    close_fds=True,
+                )
         except Exception as e:
-            if config.debug_mode:
+            if DEBUG:
                 print(f"DEBUG: Failed to play sound: {e}")
 
+    def _build_press_dispatch(self) -> dict:
+        """Map (within_debounce, pressed) to the bound press handler."""
+        return {
+            (True, False): self._tab_press_continue_hold,
+            (True, True): self._tab_press_continue_hold,
+            (False, False): self._tab_press_first,
+            (False, True): self._tab_press_repeat,
+        }
+
     def on_tab_press(self) -> tuple[bool, str]:
         """Handle Tab key press - start timing for hold detection.
 
         Returns:
             Tuple of (should_break, action_taken)
         """
-        current_time = time.time()
+        current_ns = time.monotonic_ns()
 
-        # Check if this is a quick re-press after a recent release (debounce)
-        if (
+        within_debounce = bool(
             self.tab_release_time
-            and current_time - self.tab_release_time < self.release_debounce_time
-        ):
-            if config.debug_mode:
-                print("DEBUG: Tab re-pressed within debounce window - continuing hold")
-            # This is a quick re-press, treat as continued hold
-            self.tab_physically_pressed = True
-
-            # If we're in tail period, cancel it and go back to normal recording
-            if self.recording_tail_active:
-                self.recording_tail_active = False
-                if self.on_recording_start:
-                    self.on_recording_start()
-                if config.debug_mode:
-                    print("DEBUG: Cancelled recording tail - back to normal recording")
+            and current_ns - self.tab_release_time < self._release_debounce_ns
+        )
+        handler = self._press_dispatch[(within_debounce, self.tab_physically_pressed)]
+        return handler(current_ns)
+
+    def _tab_press_continue_hold(self, current_ns: int) -> tuple[bool, str]:
+        """Quick re-press within the debounce window - treat as continued hold."""
+        if DEBUG:
+            print("DEBUG: Tab re-pressed within debounce window - continuing hold")
+        self.tab_physically_pressed = True
+
+        # If we're in tail period, cancel it and go back to normal recording
+        if self.recording_tail_active:
+            self.recording_tail_active = False
+            if self.on_recording_start:
+                self.on_recording_start()
+            if DEBUG:
+                print("DEBUG: Cancelled recording tail - back to normal recording")
 
-            return True, "continue_hold"
+        return True, "continue_hold"
 
-        # Handle first press of physical key or new press after debounce period
-        if not self.tab_physically_pressed:
-            if config.debug_mode:
-                print("DEBUG: Tab PHYSICALLY pressed (first time)")
+    def _tab_press_first(self, current_ns: int) -> tuple[bool, str]:
+        """First press of the physical key - start hold timing."""
+        if DEBUG:
+            print("DEBUG: Tab PHYSICALLY pressed (first time)")
 
-            self.tab_press_time = current_time
-            self.tab_physically_pressed = True
-            self.tab_consumed_as_hold = False
-            self.tab_release_time = None  # Clear release time
+        self.tab_press_time = current_ns
+        self.tab_physically_pressed = True
+        self.tab_consumed_as_hold = False
+        self.tab_release_time = None  # Clear release time
 
-            return True, "start_timing"
-        else:
-            # This is a keyboard repeat event - ignore it
-            if config.debug_mode:
-                print("DEBUG: Tab repeat event - ignoring")
+        return True, "start_timing"
+
+    def _tab_press_repeat(self, current_ns: int) -> tuple[bool, str]:
+        """Keyboard repeat event while held - ignore it."""
+        if DEBUG:
+            print("DEBUG: Tab repeat event - ignoring")
 
-            return True, "ignore_repeat"
+        return True, "ignore_repeat"
 
     def check_tab_hold(self) -> None:
         """Check if tab is still being held after threshold."""
         if not self.tab_physically_pressed or self.recording_mode:
             return  # Tab was already released or already recording
 
-        if config.debug_mode:
+        if DEBUG:
             print("DEBUG: Tab hold detected - starting recording mode")
 
         self.tab_consumed_as_hold = True  # Mark this press as consumed by hold
@@ -242,16 +329,16 @@ class VoiceHandler:
         Returns:
             Tuple of (should_break, action_taken)
         """
-        current_time = time.time()
+        current_ns = time.monotonic_ns()
 
-        if config.debug_mode:
+        if DEBUG:
             print("DEBUG: Tab PHYSICALLY released")
 
         if not self.tab_physically_pressed:
             return True, "already_released"
 
         self.tab_physically_pressed = False
-        self.tab_release_time = current_time  # Record release time for debouncing
+        self.tab_release_time = current_ns  # Record release time for debouncing
 
         return True, "process_release"
 
@@ -261,7 +348,7 @@ class VoiceHandler:
             # Tab is still released after debounce - start recording tail period
             self.recording_tail_active = True
 
-            if config.debug_mode:
+            if DEBUG:
                 print(
                     f"DEBUG: Starting recording tail period ({self.recording_tail_time:.1f}s)"
                 )
@@ -279,7 +366,7 @@ class VoiceHandler:
         elif self.tab_physically_pressed:
             # Tab was re-pressed during tail period - cancel tail and continue recording
             self.recording_tail_active = False
-            if config.debug_mode:
+            if DEBUG:
                 print("DEBUG: Tab re-pressed during tail period - continuing recording")
             if self.on_recording_start:
                 self.on_recording_start()  # Go back to normal recording state
@@ -293,25 +380,25 @@ class VoiceHandler:
         if not self.tab_press_time:
             return "no_press_time"
 
-        hold_duration = time.time() - self.tab_press_time
+        hold_ns = time.monotonic_ns() - self.tab_press_time
 
         if self.recording_mode:
             # We were recording, stop recording
             self.stop_voice_recording()
-            if config.debug_mode:
+            if DEBUG:
                 print(
-                    f"DEBUG: Completed hold ({hold_duration:.3f}s) - stopped recording"
+                    f"DEBUG: Completed hold ({hold_ns / 1e9:.3f}s) - stopped recording"
                 )
             return "stop_recording"
-        elif not self.tab_consumed_as_hold and hold_duration < self.tab_hold_threshold:
+        elif not self.tab_consumed_as_hold and hold_ns < self._tab_hold_threshold_ns:
             # Quick tap - should insert tab character
-            if config.debug_mode:
-                print(f"DEBUG: Quick tap ({hold_duration:.3f}s) - should INSERT TAB")
+            if DEBUG:
+                print(f"DEBUG: Quick tap ({hold_ns / 1e9:.3f}s) - should INSERT TAB")
             return "insert_tab"
         else:
-            if config.debug_mode:
+            if DEBUG:
                 print(
-                    f"DEBUG: Hold duration {hold_duration:.3f}s - already handled or too long"
+                    f"DEBUG: Hold duration {hold_ns / 1e9:.3f}s - already handled or too long"
                 )
             return "already_handled"
 
@@ -320,14 +407,14 @@ class VoiceHandler:
         if not self.tab_press_time:
             return
 
-        hold_duration = time.time() - self.tab_press_time
+        hold_ns = time.monotonic_ns() - self.tab_press_time
 
         if self.recording_mode:
             # We were recording, stop recording
             self.stop_voice_recording()
-            if config.debug_mode:
+            if DEBUG:
                 print(
-                    f"DEBUG: Completed hold ({hold_duration:.3f}s) - stopped recording"
+                    f"DEBUG: Completed hold ({hold_ns / 1e9:.3f}s) - stopped recording"
                 )
 
     def start_voice_recording(self) -> bool:
@@ -340,6 +427,7 @@ class VoiceHandler:
             return True
 
         self.recording_mode = True
+        self._stream_active = False
 
         # Audio feedback: play start sound
         self._play_sound(self.sound_record_start)
@@ -392,8 +480,14 @@ class VoiceHandler:
                 if self.on_transcription_start:
                     self.on_transcription_start()
 
-                # Start transcription
-                self.transcription_service.transcribe_async(audio_data)
+                # Start transcription. If chunks were streamed during
+                # capture, only the tail is left to decode; otherwise
+                # fall back to batch transcription of the whole take.
+                if self._stream_active:
+                    self._stream_active = False
+                    self.transcription_service.finalize_async()
+                else:
+                    self.transcription_service.transcribe_async(audio_data)
 
                 if config.debug_mode:
                     print(
@@ -425,25 +519,32 @@ class VoiceHandler:
             if config.debug_mode:
                 print("DEBUG: Voice recording stopped - no audio data captured")
 
+    def _on_audio_chunk(self, chunk) -> None:
+        """Forward captured audio for decoding while recording continues."""
+        service = self.transcription_service
+        if service is not None and self.recording_mode:
+            service.stream_chunk(chunk)
+            self._stream_active = True
+
     # Internal callbacks
     def _on_voice_recording_start(self) -> None:
         """Internal callback when voice recording starts."""
-        if config.debug_mode:
+        if DEBUG:
             print("DEBUG: Voice recording started (callback)")
 
     def _on_voice_recording_stop(self) -> None:
         """Internal callback when voice recording stops."""
-        if config.debug_mode:
+        if DEBUG:
             print("DEBUG: Voice recording stopped (callback)")
 
     def _on_transcription_start_internal(self) -> None:
         """Internal callback when transcription starts."""
-        if config.debug_mode:
+        if DEBUG:
             print("DEBUG: Transcription started")
 
     def _on_transcription_complete_internal(self, transcribed_text: str) -> None:
         """Internal callback when transcription completes successfully."""
-        if config.debug_mode:
+        if DEBUG:
             print(f"DEBUG: Transcription completed: '{transcribed_text}'")
 
         # Notify external callback
@@ -452,7 +553,7 @@ class VoiceHandler:
 
     def _on_transcription_error_internal(self, error_message: str) -> None:
         """Internal callback when transcription fails."""
-        if config.debug_mode:
+        if DEBUG:
             print(f"DEBUG: Transcription error: {error_message}")
 
         # Notify external callback
@@ -472,6 +573,11 @@ class VoiceHandler:
                 if config.debug_mode:
                     print("DEBUG: Loading transcription service in background...")
 
+                # Decode the feedback sounds here, off the UI thread, so
+                # they are ready before the model finishes loading
+                if self._sounds_available:
+                    self._preload_sounds()
+
                 transcription_service = create_transcription_service(
                     model_size=config.voice_model_size, language=config.voice_language
                 )
@@ -494,13 +600,22 @@ class VoiceHandler:
 
                 self.transcription_service = transcription_service
                 self.transcription_loading = False
+                self._ready_event.set()
 
                 if config.debug_mode:
                     print("DEBUG: Transcription service loaded successfully")
 
+                # Warm the LLM connection while already off the UI thread
+                # so the first voice improvement doesn't pay for DNS/TLS
+                if config.llm_enabled:
+                    from llm import llm_client
+
+                    llm_client.warm_connection()
+
             except Exception as e:
                 self.transcription_loading = False
                 self.transcription_failed = True
+                self._ready_event.set()
                 if config.debug_mode:
                     print(f"DEBUG: Failed to load transcription service: {e}")
 
@@ -11,17 +11,30 @@ import sounddevice as sd
 class VoiceRecorder:
     """Handles audio recording with real-time feedback."""
 
+    # Upper bound on a single recording; sized so the capture buffer can
+    # be preallocated once instead of concatenating chunks per stop
+    MAX_RECORDING_SECONDS = 120
+
     def __init__(self, sample_rate: int = 16000, channels: int = 1):
         self.sample_rate = sample_rate
         self.channels = channels
         self.is_recording = False
-        self.audio_data = []
         self.recording_thread: Optional[threading.Thread] = None
 
+        # Preallocated capture buffer with a write cursor; the audio
+        # callback copies samples straight in, so stop_recording only
+        # slices instead of building and concatenating a chunk list
+        self._max_samples = sample_rate * channels * self.MAX_RECORDING_SECONDS
+        self._buffer = np.empty(self._max_samples, dtype=np.float32)
+        self._write_pos = 0
+
         # Callbacks for UI feedback
         self.on_recording_start: Optional[Callable] = None
         self.on_recording_stop: Optional[Callable] = None
         self.on_audio_level: Optional[Callable[[float], None]] = None
+        # Streaming hook: receives each captured chunk so transcription
+        # can decode while recording is still in progress
+        self.on_audio_chunk: Optional[Callable[[np.ndarray], None]] = None
 
     def start_recording(self) -> bool:
         """Start recording audio. Returns True if successful."""
@@ -29,7 +42,7 @@ class VoiceRecorder:
             return False
 
         try:
-            self.audio_data = []
+            self._write_pos = 0
             self.is_recording = True
 
             # Start recording in a separate thread
@@ -59,10 +72,9 @@ class VoiceRecorder:
         if self.on_recording_stop:
             self.on_recording_stop()
 
-        # Convert to numpy array if we have data
-        if self.audio_data:
-            audio_array = np.concatenate(self.audio_data, axis=0)
-            return audio_array.flatten()
+        # Hand back a copy of the captured slice so the buffer can be reused
+        if self._write_pos > 0:
+            return self._buffer[: self._write_pos].copy()
 
         return None
 
@@ -74,8 +86,20 @@ class VoiceRecorder:
                 print(f"Audio callback status: {status}")
 
             if self.is_recording:
-                # Store audio data
-                self.audio_data.append(indata.copy())
+                # Copy samples into the preallocated buffer
+                samples = indata.reshape(-1)
+                end = self._write_pos + len(samples)
+                if end > self._max_samples:
+                    # Buffer full - keep what fits, drop the rest
+                    samples = samples[: self._max_samples - self._write_pos]
+                    end = self._max_samples
+                self._buffer[self._write_pos : end] = samples
+                self._write_pos = end
+
+                # Forward a copy for incremental decoding; the buffer
+                # slice is reused by the next callback
+                if self.on_audio_chunk:
+                    self.on_audio_chunk(samples.copy())
 
                 # Calculate audio level for visual feedback
                 if self.on_audio_level: